@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Aho-Corasick multi-pattern substring matcher
+
+Compiles a fixed set of patterns (brand names, alias variants, ...) into one
+automaton, so finding every pattern contained in a company name is a single
+pass over the name instead of one `in` test per pattern. Patterns are matched
+character by character, so non-Latin variants like アップル or 삼성 work the
+same as ASCII ones. words() only reports occurrences that are whole words
+("ford" in "ford motor", not in "oxford").
+"""
+
+from collections import deque
+from typing import Dict, Hashable, Iterable, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """Automaton over (pattern, value) pairs
+
+    Several patterns may share a value (e.g. every variant of one alias) and
+    one pattern may carry several values. The empty pattern is contained in
+    every text, like `'' in text`.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Hashable]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Hashable]]] = [[]]  # (pattern length, value)
+        self._empty: List[Hashable] = []
+
+        for pattern, value in patterns:
+            if not pattern:
+                self._empty.append(value)
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            self._out[state].append((len(pattern), value))
+
+        # Breadth-first so every fail target is finished before it is used
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+                queue.append(next_state)
+
+    def __len__(self) -> int:
+        """Number of states, including the root"""
+        return len(self._goto)
+
+    def _hits(self, text: str) -> Iterator[Tuple[int, int, Hashable]]:
+        """(end index, pattern length, value) for every non-empty pattern occurrence in text"""
+        state = 0
+        for end, char in enumerate(text, start=1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, value in self._out[state]:
+                yield end, length, value
+
+    def iter(self, text: str) -> Iterator[Tuple[int, Hashable]]:
+        """(end index, value) for every pattern occurrence in text"""
+        for value in self._empty:
+            yield 0, value
+        for end, _, value in self._hits(text):
+            yield end, value
+
+    def words(self, text: str) -> Iterator[Tuple[int, Hashable]]:
+        """(end index, value) for every pattern occurrence in text that is a whole word"""
+        for end, length, value in self._hits(text):
+            if whole_word(text, end - length, end):
+                yield end, value
+
+    def matches(self, text: str) -> set:
+        """Values of every pattern contained in text"""
+        return {value for _, value in self.iter(text)}
+
+
+def whole_word(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end] is not part of a longer Latin word ("ford" in "oxford")
+
+    Scripts written without spaces (アップルジャパン, 上海市) have no word edges to check.
+    """
+    def joined(edge: str, neighbour: str) -> bool:
+        return edge.isascii() and edge.isalnum() and neighbour.isalnum()
+
+    return not (start and joined(text[start], text[start - 1])) and \
+        not (end < len(text) and joined(text[end - 1], text[end]))
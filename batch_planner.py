@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Cost-aware batch planning
+
+Equal-size slices of the export do not take equal time: a batch's cost is
+dominated by the unique companies it has to match, and a company that is
+neither cached nor an exact/alias/contains hit goes down the fuzzy path,
+which costs far more than the per-lead enrich + score work. The planner
+estimates each company's cost once (cache hit, exact, fuzzy) and cuts the
+export into contiguous row ranges whose estimated cost is as even as
+possible: a batch pays COST_ROW per lead plus its companies' cost the first
+time each appears in it, since repeats are resolved from the batch's memo.
+
+Row ranges stay contiguous so a batch is still "rows start-end" of the
+export. plan_shards instead keeps every lead of a company in one batch,
+picked by a stable hash of the normalized name, so each company is matched,
+categorized and researched by one worker only; a company too big for one
+batch is split over the least loaded ones so batches stay balanced.
+
+Either plan becomes an assignment (batch index per row) that
+orchestrate_agents cuts into small chunks for work stealing: workers pull
+chunks from a shared queue, so one that finishes early keeps taking work
+instead of idling while a slow batch finishes.
+
+Companies and assignments are run-length encoded, as (company, rows) and
+(batch index, rows) runs of consecutive rows, so a plan holds one entry per
+run rather than one per lead: a range batch is a single run, and leads of
+one company listed together share one.
+"""
+
+import hashlib
+from collections import defaultdict
+from itertools import groupby, repeat
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from engine import COMPANY_ALIASES, MIN_CONTAINED
+from golden_sheet import GoldenSheet
+from match_cache import MatchCache
+
+# Relative cost estimates, in units of one lead's enrich + score work
+COST_ROW = 1.0
+COST_CACHED = 0.5
+COST_EXACT = 2.0
+COST_FUZZY = 40.0
+
+STEAL_CHUNK = 200  # leads per work-stealing chunk
+SHARD_SLACK = 0.1  # a shard may exceed the average cost by this share before overflowing
+
+Range = Tuple[int, int]
+Run = Tuple[Hashable, int]  # (value, number of consecutive rows)
+
+
+def run_length(values: Iterable[Hashable]) -> List[Run]:
+    """(value, rows) runs of consecutive equal values"""
+    return [(value, sum(1 for _ in group)) for value, group in groupby(values)]
+
+
+def expand(runs: Iterable[Run]) -> Iterator[Hashable]:
+    """The value of every row of runs"""
+    for value, rows in runs:
+        yield from repeat(value, rows)
+
+
+def merge_runs(first: Iterable[Run], second: Iterable[Run]) -> Iterator[Tuple[Hashable, Hashable, int]]:
+    """(first value, second value, rows) runs of two encodings of the same rows"""
+    second = iter(second)
+    other, left = None, 0
+    for value, rows in first:
+        while rows:
+            if not left:
+                other, left = next(second)
+            step = min(rows, left)
+            yield value, other, step
+            rows -= step
+            left -= step
+
+
+def company_costs(companies: Iterable[str], golden_sheet: GoldenSheet,
+                  match_cache: Optional[MatchCache] = None) -> Dict[str, float]:
+    """Estimated matching cost of each unique normalized company"""
+    known = match_cache.known() if match_cache else set()
+    index = golden_sheet.brand_index
+    costs = {}
+    for company in set(companies):
+        if not company:
+            costs[company] = 0.0
+        elif company in known:
+            costs[company] = COST_CACHED
+        elif (COMPANY_ALIASES.get(company) in golden_sheet.by_name or index.lookup(company) is not None
+              or any(len(index.names[pos]) >= MIN_CONTAINED
+                     for pos in index.containing(company) + index.contained_in(company))):
+            costs[company] = COST_EXACT
+        else:
+            costs[company] = COST_FUZZY
+    return costs
+
+
+def _greedy(companies: Sequence[Run], costs: Dict[str, float], capacity: float) -> List[Range]:
+    """Ranges filled in order until the next lead would push one past capacity"""
+    ranges = []
+    start = 0
+    total = 0.0
+    seen = set()
+    for row, company in enumerate(expand(companies)):
+        cost = COST_ROW + (costs[company] if company not in seen else 0.0)
+        if total + cost > capacity and row > start:
+            ranges.append((start, row))
+            start, total, seen = row, 0.0, set()
+            cost = COST_ROW + costs[company]
+        total += cost
+        seen.add(company)
+    rows = sum(rows for _, rows in companies)
+    if start < rows:
+        ranges.append((start, rows))
+    return ranges
+
+
+def batch_cost(companies: Sequence[Run], costs: Dict[str, float]) -> float:
+    """Estimated cost of one batch of leads, given as company runs"""
+    return (COST_ROW * sum(rows for _, rows in companies)
+            + sum(costs[company] for company in {company for company, _ in companies}))
+
+
+def plan_batches(companies: Sequence[Run], costs: Dict[str, float], num_batches: int) -> List[Range]:
+    """At most num_batches contiguous (start, end) row ranges minimizing the costliest
+
+    companies are runs of the export's normalized company names in row
+    order. The smallest capacity for which greedy filling needs no more than
+    num_batches ranges is found by bisection.
+    """
+    if not companies:
+        return []
+    low = max(COST_ROW + costs[company] for company, _ in companies)
+    high = max(low, batch_cost(companies, costs))
+    for _ in range(50):
+        middle = (low + high) / 2
+        if len(_greedy(companies, costs, middle)) <= num_batches:
+            high = middle
+        else:
+            low = middle
+        if high - low < COST_ROW / 2:
+            break
+    return _greedy(companies, costs, high)
+
+
+def range_assignment(ranges: Sequence[Range]) -> List[Run]:
+    """Batch index runs of contiguous (start, end) ranges"""
+    return [(batch, end - start) for batch, (start, end) in enumerate(ranges)]
+
+
+def shard_of(company: str, num_shards: int) -> int:
+    """Stable shard of a normalized company name (unlike hash(), the same in every process and run)"""
+    digest = hashlib.blake2b(company.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % num_shards
+
+
+def _take(group: List[Range], rows: int) -> Tuple[List[Range], List[Range]]:
+    """The first rows rows of (start, end) row ranges, and the rest"""
+    head = []
+    for i, (start, end) in enumerate(group):
+        step = min(rows, end - start)
+        head.append((start, start + step))
+        rows -= step
+        if not rows:
+            return head, ([(start + step, end)] if start + step < end else []) + group[i + 1:]
+    return head, []
+
+
+def plan_shards(companies: Sequence[Run], costs: Dict[str, float], num_shards: int,
+                slack: float = SHARD_SLACK) -> List[Run]:
+    """Batch index runs of the rows, keeping every company's leads in one batch
+
+    Companies are placed from the costliest down in their shard_of shard,
+    or in the least loaded shard once that one would exceed the average
+    cost by more than slack. A company costlier than that on its own (one
+    employer dominating the export) is split over the least loaded shards,
+    paying its matching cost once in each.
+    """
+    ranges = defaultdict(list)  # company -> its (start, end) row ranges
+    start = 0
+    for company, rows in companies:
+        ranges[company].append((start, start + rows))
+        start += rows
+    leads = {company: sum(end - start for start, end in group) for company, group in ranges.items()}
+    capacity = batch_cost(companies, costs) / num_shards * (1 + slack)
+    loads = [0.0] * num_shards
+    placed = []  # (start, end, shard)
+
+    def place(shard, company_ranges, company):
+        placed.extend((start, end, shard) for start, end in company_ranges)
+        loads[shard] += COST_ROW * sum(end - start for start, end in company_ranges) + costs[company]
+
+    for company in sorted(ranges, key=lambda c: (-COST_ROW * leads[c] - costs[c], c)):
+        group = ranges[company]
+        cost = COST_ROW * leads[company] + costs[company]
+        shard = shard_of(company, num_shards)
+        if loads[shard] + cost > capacity:
+            shard = min(range(num_shards), key=loads.__getitem__)
+        if loads[shard] + cost <= capacity:
+            place(shard, group, company)
+            continue
+        while group:
+            shard = min(range(num_shards), key=loads.__getitem__)
+            room = int((capacity - loads[shard] - costs[company]) // COST_ROW)
+            head, group = _take(group, max(1, room))
+            place(shard, head, company)
+    return [(shard, sum(end - start for start, end, _ in group))
+            for shard, group in groupby(sorted(placed), key=lambda piece: piece[2])]
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark bulk brand matching against the per-row SequenceMatcher loop
+
+Builds synthetic exports of 10k, 100k and 1M leads from the real company
+names plus perturbed pivot brand names, then times:
+- per-row: normalize + exact/contains scan + SequenceMatcher over every brand,
+  once per lead (what the old enrich_batch_N.py scripts did)
+- bulk: one match table over unique companies via bulk_match, fanned out
+  (index lookups, then SequenceMatcher on the blocked trigram top-k; there
+  is no NumPy all-pairs similarity pass)
+The per-row loop is timed on a sample and extrapolated linearly for large
+exports (marked with *), since a full 1M-lead run takes hours.
+"""
+
+import argparse
+import csv
+import random
+import time
+from difflib import SequenceMatcher
+from operator import attrgetter
+
+from brand_index import BrandIndex
+from bulk_match import LEADS_FILE, match_table
+from engine import FUZZY_THRESHOLD, MIN_CONTAINED
+from golden_sheet import CATEGORY_FILE, PIVOT_FILE, load_golden_sheet
+from name_normalization import normalize_name
+
+SIZES = [10_000, 100_000, 1_000_000]
+UNIQUE_RATIO = 0.1  # exports run ~10 leads per company
+PER_ROW_SAMPLE = 2_000
+
+
+def perturb(name, rng):
+    """Copy of name with a random typo, suffix or prefix"""
+    choice = rng.random()
+    if choice < 0.3 and len(name) > 3:
+        i = rng.randrange(len(name))
+        return name[:i] + name[i + 1:]
+    if choice < 0.6:
+        return f"{name} {rng.choice(['Inc.', 'Company', 'Group', 'UK', 'Studios', 'Labs'])}"
+    if choice < 0.8:
+        return f"The {name} Company"
+    return ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz ') for _ in range(rng.randint(5, 20))).strip()
+
+
+def synthetic_companies(n, real_companies, brand_names, rng):
+    """n lead company names drawn from a pool of n * UNIQUE_RATIO unique names"""
+    pool = list(real_companies)
+    while len(pool) < max(int(n * UNIQUE_RATIO), 1):
+        pool.append(perturb(rng.choice(brand_names + real_companies), rng))
+    return [rng.choice(pool) for _ in range(n)]
+
+
+def per_row_match(company, brand_names):
+    """The current enrichment loop: exact/contains scan, then full fuzzy scan"""
+    company_norm = normalize_name(company)
+    for i, brand_norm in enumerate(normalize_name(b) for b in brand_names):
+        if company_norm == brand_norm or company_norm in brand_norm or brand_norm in company_norm:
+            return i
+
+    best_match = None
+    best_score = FUZZY_THRESHOLD
+    for i, brand in enumerate(brand_names):
+        score = SequenceMatcher(None, company_norm, normalize_name(brand)).ratio()
+        if score > best_score:
+            best_score = score
+            best_match = i
+    return best_match
+
+
+def time_per_row(companies, brand_names):
+    """Seconds for the per-row loop, extrapolated from a sample if needed"""
+    sample = companies[:PER_ROW_SAMPLE]
+    start = time.perf_counter()
+    for company in sample:
+        per_row_match(company, brand_names)
+    elapsed = time.perf_counter() - start
+    return elapsed * len(companies) / len(sample), len(sample) < len(companies)
+
+
+def time_bulk(companies, brands):
+    """Seconds for index build + match table over unique companies + fan-out"""
+    start = time.perf_counter()
+    brand_index = BrandIndex(brands, normalize_name, key=attrgetter('name'))
+    normalized = [normalize_name(company) for company in companies]
+    table = match_table(normalized, brand_index, FUZZY_THRESHOLD, MIN_CONTAINED)
+    matches = [table.get(company, (None, 0.0))[0] for company in normalized]
+    return time.perf_counter() - start, len(table), len(matches)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk brand matching against the per-row loop")
+    parser.add_argument('sizes', nargs='*', type=int, default=SIZES,
+                        help=f"export sizes in leads (default: {' '.join(map(str, SIZES))})")
+    sizes = parser.parse_args().sizes
+    rng = random.Random(42)
+
+    brands = load_golden_sheet(PIVOT_FILE, CATEGORY_FILE).brands
+    brand_names = [brand.name for brand in brands]
+    with open(LEADS_FILE, 'r', encoding='utf-8') as f:
+        real_companies = sorted({lead['inline-flex'] for lead in csv.DictReader(f) if lead['inline-flex']})
+
+    print("=" * 80)
+    print(f"BRAND MATCHING BENCHMARK ({len(brands)} brands)")
+    print("=" * 80)
+    print(f"\n{'Leads':>10} {'Unique':>8} {'Per-row (s)':>14} {'Bulk (s)':>10} {'Speedup':>9}")
+
+    for n in sizes:
+        companies = synthetic_companies(n, real_companies, brand_names, rng)
+        per_row, extrapolated = time_per_row(companies, brand_names)
+        bulk, unique, _ = time_bulk(companies, brands)
+        marker = '*' if extrapolated else ' '
+        print(f"{n:>10,} {unique:>8,} {per_row:>13.1f}{marker} {bulk:>10.2f} {per_row / bulk:>8.0f}x")
+
+    print(f"\n* extrapolated from the first {PER_ROW_SAMPLE:,} leads")
+
+
+if __name__ == '__main__':
+    main()
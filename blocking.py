@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Blocking keys for fuzzy brand matching
+
+Before any SequenceMatcher work, a company is only compared against brands
+that share at least one cheap key with it:
+- the first significant token ("ford motor" -> "ford")
+- a phonetic code of that token (simplified Double Metaphone, primary and
+  alternate), so "Addidas" still meets "Adidas"
+- the first character plus a length bucket, with neighbouring buckets probed
+  at query time, for names whose first token is misspelled
+
+This is the usual record-linkage trick: the work per company grows with the
+size of its blocks rather than with the size of the Golden Sheet.
+"""
+
+import re
+from typing import List, Set, Tuple
+
+LENGTH_BUCKET = 4
+PHONETIC_LENGTH = 4
+STOP_TOKENS = {'the', 'and', 'of', 'by', 'a'}
+TOKEN_SPLIT = re.compile(r'[\W_]+')
+VOWELS = set('AEIOUY')
+
+
+def first_token(name: str) -> str:
+    """First token of a normalized name that is not an article or connective"""
+    tokens = [token for token in TOKEN_SPLIT.split(name) if token]
+    for token in tokens:
+        if token not in STOP_TOKENS:
+            return token
+    return tokens[0] if tokens else ''
+
+
+def phonetic_codes(word: str) -> Tuple[str, str]:
+    """(primary, alternate) phonetic code of a word
+
+    A compact take on Double Metaphone covering the rules that matter for
+    brand names: silent leading letters, soft C/G, CH/SH/TH/PH digraphs,
+    silent GH and collapsed double letters. Words without Latin letters
+    (e.g. アップル) get empty codes and simply have no phonetic block.
+    """
+    word = ''.join(char for char in word.upper() if 'A' <= char <= 'Z')
+    if not word:
+        return '', ''
+
+    primary: List[str] = []
+    alternate: List[str] = []
+
+    def add(main: str, alt: str = None):
+        primary.append(main)
+        alternate.append(main if alt is None else alt)
+
+    i = 0
+    if word[:2] in ('KN', 'GN', 'PN', 'WR', 'AE'):
+        i = 1
+    elif word[0] == 'X':
+        add('S')
+        i = 1
+    elif word[:2] == 'WH':
+        add('W')
+        i = 2
+
+    while i < len(word) and len(primary) < PHONETIC_LENGTH * 2:
+        char = word[i]
+        nxt = word[i + 1] if i + 1 < len(word) else ''
+        prev = word[i - 1] if i > 0 else ''
+
+        if char == prev and char != 'C':
+            i += 1
+            continue
+
+        if char in VOWELS:
+            if i == 0:
+                add('A')
+        elif char == 'B':
+            if not (prev == 'M' and i == len(word) - 1):
+                add('P')
+        elif char == 'C':
+            if nxt == 'H':
+                add('X', 'K')
+                i += 1
+            elif nxt in ('I', 'E', 'Y'):
+                add('S')
+            elif prev != 'S' or nxt != 'K':
+                add('K')
+        elif char == 'D':
+            if nxt == 'G' and word[i + 2:i + 3] in ('I', 'E', 'Y'):
+                add('J')
+                i += 1
+            else:
+                add('T')
+        elif char == 'G':
+            if nxt == 'H' and word[i + 2:i + 3] not in VOWELS:
+                i += 1
+            elif nxt == 'N':
+                pass
+            elif nxt in ('I', 'E', 'Y'):
+                add('J', 'K')
+            else:
+                add('K')
+        elif char == 'H':
+            if nxt in VOWELS and prev not in VOWELS:
+                add('H')
+        elif char == 'J':
+            add('J', 'H')
+        elif char == 'K':
+            if prev != 'C':
+                add('K')
+        elif char == 'P':
+            if nxt == 'H':
+                add('F')
+                i += 1
+            else:
+                add('P')
+        elif char == 'Q':
+            add('K')
+        elif char == 'S':
+            if nxt == 'H':
+                add('X')
+                i += 1
+            elif word[i + 1:i + 3] in ('IO', 'IA'):
+                add('X', 'S')
+            else:
+                add('S')
+        elif char == 'T':
+            if nxt == 'H':
+                add('0', 'T')
+                i += 1
+            elif word[i + 1:i + 3] in ('IO', 'IA'):
+                add('X')
+            else:
+                add('T')
+        elif char == 'V':
+            add('F')
+        elif char == 'W':
+            if nxt in VOWELS:
+                add('W')
+        elif char == 'X':
+            add('KS')
+        elif char == 'Z':
+            add('S')
+        else:
+            add(char)
+        i += 1
+
+    return ''.join(primary)[:PHONETIC_LENGTH], ''.join(alternate)[:PHONETIC_LENGTH]
+
+
+def blocking_keys(name: str) -> Set[Tuple[str, str]]:
+    """Keys a brand is filed under in the blocking index"""
+    if not name:
+        return set()
+    token = first_token(name)
+    keys = {('token', token), ('length', f'{name[0]}{len(name) // LENGTH_BUCKET}')}
+    keys.update(('phonetic', code) for code in phonetic_codes(token) if code)
+    return keys
+
+
+def query_keys(name: str) -> Set[Tuple[str, str]]:
+    """Keys to probe for a company: its own plus the neighbouring length buckets"""
+    keys = blocking_keys(name)
+    if name:
+        bucket = len(name) // LENGTH_BUCKET
+        keys.update(('length', f'{name[0]}{b}') for b in (bucket - 1, bucket + 1))
+    return keys
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Brand index for matching lead companies to Golden Sheet brands
+
+Built once from the pivot table so that each lead only looks at the handful of
+brands that could possibly match it, instead of scanning every pivot row for
+the exact, contains and fuzzy passes. Brands contained in a company name come
+from one Aho-Corasick pass over the name. Fuzzy matching only runs
+SequenceMatcher on the top-k brands by shared character trigrams.
+"""
+
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from aho_corasick import AhoCorasick
+from blocking import blocking_keys, query_keys
+from similarity import SimilarityKernel
+
+TOKEN_SPLIT = re.compile(r'[\W_]+')
+NGRAM_SIZE = 3
+TOP_K = 10
+
+
+def tokenize(name: str) -> List[str]:
+    """Split a normalized name into word tokens"""
+    return [token for token in TOKEN_SPLIT.split(name) if token]
+
+
+def ngrams(name: str, size: int = NGRAM_SIZE) -> set:
+    """Character n-grams of a name, padded so short names still get some"""
+    padded = f' {name} '
+    return {padded[i:i + size] for i in range(max(len(padded) - size + 1, 1))}
+
+
+class BrandIndex:
+    """Hash, suffix, automaton and inverted-token index over normalized brand names
+
+    Brands keep their pivot table order: every lookup returns positions in
+    ascending order so callers that take the first hit behave exactly like the
+    old linear scans.
+    """
+
+    def __init__(self, brands: Sequence, normalize: Callable[[str], str],
+                 key: Optional[Callable] = None):
+        self.brands = list(brands)
+        self.normalize = normalize
+        self.names = [normalize(key(brand) if key else brand) for brand in self.brands]
+
+        self._exact: Dict[str, int] = {}
+        self._suffixes: List[Tuple[str, int]] = []
+        self._tokens: Dict[str, List[int]] = defaultdict(list)
+        self._ngrams: List[set] = [set() for _ in self.names]
+        self._blocks: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+
+        for pos, name in enumerate(self.names):
+            if not name:
+                continue
+            self._exact.setdefault(name, pos)
+
+            for start in range(len(name)):
+                self._suffixes.append((name[start:], pos))
+
+            for token in set(tokenize(name)):
+                self._tokens[token].append(pos)
+
+            self._ngrams[pos] = ngrams(name)
+            for key in blocking_keys(name):
+                self._blocks[key].append(pos)
+
+        # Every substring of a brand name is a prefix of one of its suffixes
+        self._suffixes.sort()
+        self._automaton = AhoCorasick(self._exact.items())
+        self._similarity = SimilarityKernel(self.names)
+
+    def __len__(self) -> int:
+        return len(self.brands)
+
+    def get(self, brand_name: str):
+        """Indexed brand whose name normalizes like brand_name
+
+        Brands that normalize identically are indistinguishable to every pass,
+        so the first one is the one any lookup would have returned.
+        """
+        pos = self._exact.get(self.normalize(brand_name))
+        return self.brands[pos] if pos is not None else None
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Position of the first brand whose normalized name equals name"""
+        return self._exact.get(name)
+
+    def containing(self, fragment: str) -> List[int]:
+        """Positions of brands whose normalized name contains fragment"""
+        if not fragment:
+            # Same as `'' in brand_norm`: the empty string is in every brand
+            return [pos for pos, name in enumerate(self.names) if name]
+
+        found = set()
+        i = bisect_left(self._suffixes, (fragment,))
+        while i < len(self._suffixes) and self._suffixes[i][0].startswith(fragment):
+            found.add(self._suffixes[i][1])
+            i += 1
+        return sorted(found)
+
+    def containing_any(self, fragments: Iterable[str]) -> List[int]:
+        """Positions of brands whose normalized name contains any fragment"""
+        found = set()
+        for fragment in fragments:
+            found.update(self.containing(fragment))
+        return sorted(found)
+
+    def contained_in(self, text: str) -> List[int]:
+        """Positions of brands whose normalized name is a substring of text"""
+        return sorted(self._automaton.matches(text))
+
+    def related(self, name: str) -> List[int]:
+        """Positions of brands sharing at least one token with name"""
+        found = set()
+        for token in tokenize(name):
+            found.update(self._tokens.get(token, ()))
+        return sorted(found)
+
+    def block(self, name: str) -> List[int]:
+        """Positions of brands sharing at least one blocking key with name"""
+        found = set()
+        for key in query_keys(name):
+            found.update(self._blocks.get(key, ()))
+        return sorted(found)
+
+    def nearest(self, name: str, k: int = TOP_K) -> List[int]:
+        """Positions of the k brands in name's blocks sharing the most trigrams
+
+        Brands are ranked by Dice overlap of their trigram sets, which is cheap
+        and tracks SequenceMatcher closely enough that the true best fuzzy
+        match lands in the top k.
+        """
+        grams = ngrams(name)
+
+        def overlap(pos):
+            brand_grams = self._ngrams[pos]
+            return -len(grams & brand_grams) / (len(grams) + len(brand_grams)), pos
+
+        return sorted(sorted(self.block(name), key=overlap)[:k])
+
+    def candidates(self, name: str, extra: Iterable[int] = ()) -> List[int]:
+        """Every brand an exact, contains or fuzzy pass could pick for name
+
+        Extra positions (e.g. brands hit by an alias table) are merged in.
+        """
+        found = set(self.containing(name))
+        found.update(self.contained_in(name))
+        found.update(self.related(name))
+        found.update(self.nearest(name))
+        found.update(extra)
+        return sorted(found)
+
+    def ratio_above(self, name: str, pos: int, cutoff: float,
+                    inclusive: bool = False) -> Optional[float]:
+        """SequenceMatcher ratio of name against a brand if it beats cutoff"""
+        return self._similarity.ratio_above(name, pos, cutoff, inclusive)
+
+    def best_fuzzy(self, name: str, positions: Iterable[int], threshold: float,
+                   inclusive: bool = False) -> Tuple[Optional[int], float]:
+        """Best SequenceMatcher ratio above threshold among positions
+
+        Ties go to the earliest brand, like the old `score > best_score` loops.
+        With inclusive, a score equal to threshold also qualifies. Each brand
+        only has to beat the best score so far, so most are rejected by the
+        kernel's cheap bounds.
+        """
+        best_pos = None
+        best_score = threshold
+        for pos in positions:
+            score = self._similarity.ratio_above(name, pos, best_score, inclusive and best_pos is None)
+            if score is not None:
+                best_score = score
+                best_pos = pos
+        return best_pos, best_score
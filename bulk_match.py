@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Bulk brand matching for a whole lead export
+
+Resolves every unique company once: exact and contains matches come from the
+BrandIndex hash, suffix and automaton indexes, and the rest are re-scored with
+SequenceMatcher against the top-k brands by shared trigrams within their
+blocks (BrandIndex.nearest), so the fuzzy threshold keeps its current meaning
+and no company is compared with every brand. The resulting match table feeds
+the usual enrichment columns.
+
+An earlier version scored every company against every brand in one NumPy
+pass over dense trigram vectors. Its memory grew with companies x brands,
+so that all-pairs pass was dropped for the blocked top-k.
+"""
+
+import csv
+import os
+from typing import Dict, Optional, Sequence, Tuple
+
+from brand_index import BrandIndex
+from golden_sheet import CATEGORY_FILE, PIVOT_FILE, Brand, load_golden_sheet
+from name_normalization import normalize_name
+from platform_matrix import PlatformMatrix
+
+# Configuration
+LEADS_FILE = "Exports_Leads_BrandManager.csv"
+MATCH_TABLE_FILE = "enriched_results/golden_sheet_matches.csv"
+# The engine's matching thresholds (engine.py imports them from here)
+FUZZY_THRESHOLD = 0.75
+MIN_CONTAINED = 4  # shortest brand name a company may merely contain
+
+
+def match_table(companies: Sequence[str], brand_index: BrandIndex, threshold: float = FUZZY_THRESHOLD,
+                min_contained: int = MIN_CONTAINED) -> Dict[str, Tuple[Optional[int], float]]:
+    """Resolve each unique normalized company to (brand position, score)
+
+    Exact and contains matches come straight from the index; everything else
+    takes the best SequenceMatcher ratio above threshold among the top-k
+    brands of its blocks. Brands shorter than min_contained
+    (e.g. "tu" inside "future") only match exactly or fuzzily.
+    """
+    unique = sorted({company for company in companies if company})
+    table: Dict[str, Tuple[Optional[int], float]] = {}
+
+    for company in unique:
+        pos = brand_index.lookup(company)
+        if pos is not None:
+            table[company] = (pos, 1.0)
+            continue
+        contained = sorted(pos for pos in set(brand_index.containing(company)) | set(brand_index.contained_in(company))
+                           if len(brand_index.names[pos]) >= min_contained)
+        if contained:
+            table[company] = (contained[0], 0.9)
+            continue
+        table[company] = brand_index.best_fuzzy(company, brand_index.nearest(company), threshold)
+
+    return table
+
+
+def enrichment_columns(brand: Optional[Brand], platform_matrix: PlatformMatrix) -> Dict[str, str]:
+    """Golden Sheet columns for a lead matched to brand (or unmatched)"""
+    if not brand:
+        return {
+            'brand_in_golden_sheet': 'No',
+            'total_assets_tested': '',
+            'platforms_tested': '',
+            'platform_breakdown': '',
+            'markets_tested': '',
+        }
+
+    return {
+        'brand_in_golden_sheet': 'Yes',
+        'total_assets_tested': str(brand.total),
+        'platforms_tested': platform_matrix.tested(brand.name),
+        'platform_breakdown': platform_matrix.breakdown(brand.name),
+        'markets_tested': brand.markets_list,
+    }
+
+
+def main():
+    print("=" * 80)
+    print("BULK GOLDEN SHEET MATCHING")
+    print("=" * 80)
+
+    with open(LEADS_FILE, 'r', encoding='utf-8') as f:
+        companies = [normalize_name(lead.get('inline-flex', '')) for lead in csv.DictReader(f)]
+
+    sheet = load_golden_sheet(PIVOT_FILE, CATEGORY_FILE)
+    brand_index = sheet.brand_index
+
+    table = match_table(companies, brand_index)
+    matched = sum(1 for pos, _ in table.values() if pos is not None)
+
+    os.makedirs(os.path.dirname(MATCH_TABLE_FILE), exist_ok=True)
+    with open(MATCH_TABLE_FILE, 'w', newline='', encoding='utf-8') as f:
+        fieldnames = ['company', 'matched_brand', 'match_score', 'brand_in_golden_sheet',
+                      'total_assets_tested', 'platforms_tested', 'platform_breakdown', 'markets_tested']
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for company, (pos, score) in sorted(table.items()):
+            brand = brand_index.brands[pos] if pos is not None else None
+            writer.writerow({
+                'company': company,
+                'matched_brand': brand.name if brand else '',
+                'match_score': f'{score:.2f}' if brand else '',
+                **enrichment_columns(brand, sheet.platform_matrix),
+            })
+
+    print(f"\nLeads: {len(companies)}")
+    print(f"Unique companies: {len(table)}")
+    print(f"Matched to Golden Sheet: {matched} ({matched / max(len(table), 1) * 100:.1f}%)")
+    print(f"\nMatch table saved to: {MATCH_TABLE_FILE}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Compiled, data-driven company categorizer
+
+Category rules live as data in category_rules.py: an ordered list of rules
+per ruleset, the first matching rule wins, and a default applies when none
+do. At load time every keyword of a ruleset is compiled into two Aho-Corasick
+automata (one for company names, one for industries), so categorizing a
+(company, industry) pair is one scan of each string followed by cheap set
+checks, instead of dozens of sequential `'x' in company_lower` tests.
+
+Given the industry vocabulary (industry_categories.py), a Categorizer also
+precomputes the category each industry gets on its own. A company that hits
+no company keyword or name then costs a single dict lookup; the rules only run
+for company-name overrides and unseen industries.
+"""
+
+from typing import AbstractSet, FrozenSet, Iterable, NamedTuple, Sequence, Tuple
+
+from aho_corasick import AhoCorasick
+
+
+class When(NamedTuple):
+    """Condition that holds if ANY of its keywords/names match
+
+    company / industry: substrings of the lowercased company name / industry
+    company_is / industry_is: exact (case-sensitive) company name / industry
+    """
+    company: Sequence[str] = ()
+    industry: Sequence[str] = ()
+    company_is: Sequence[str] = ()
+    industry_is: Sequence[str] = ()
+
+
+class Rule(NamedTuple):
+    """Category assigned when ALL of its conditions hold"""
+    category: str
+    conditions: Tuple[When, ...]
+
+
+class Ruleset(NamedTuple):
+    rules: Sequence[Rule]
+    default: str
+
+
+def rule(category: str, *conditions: When) -> Rule:
+    """Rule(category, conditions) without spelling out the tuple"""
+    return Rule(category, conditions)
+
+
+class _CompiledCondition(NamedTuple):
+    company: FrozenSet[str]
+    industry: FrozenSet[str]
+    company_is: FrozenSet[str]
+    industry_is: FrozenSet[str]
+
+
+class Categorizer:
+    """Ruleset compiled for one-pass categorization"""
+
+    def __init__(self, ruleset: Ruleset, industries: Iterable[str] = ()):
+        self.default = ruleset.default
+        self._rules = [
+            (r.category, [_CompiledCondition(frozenset(c.company), frozenset(c.industry),
+                                             frozenset(c.company_is), frozenset(c.industry_is))
+                          for c in r.conditions])
+            for r in ruleset.rules
+        ]
+        conditions = [c for r in ruleset.rules for c in r.conditions]
+        self._company = AhoCorasick({(k, k) for c in conditions for k in c.company})
+        self._industry = AhoCorasick({(k, k) for c in conditions for k in c.industry})
+        self._company_names = frozenset(name for c in conditions for name in c.company_is)
+        self._by_industry = {industry: self.industry_category(industry) for industry in industries}
+
+    def industry_category(self, industry: str) -> str:
+        """Category industry gets for a company that triggers no company rule"""
+        return self._first_match(frozenset(), None, industry)
+
+    def categorize(self, company_name: str, industry: str) -> str:
+        """Category of the first rule matching company_name and industry"""
+        company_hits = self._company.matches(company_name.lower() if company_name else '')
+        if not company_hits and company_name not in self._company_names:
+            category = self._by_industry.get(industry)
+            if category is not None:
+                return category
+        return self._first_match(company_hits, company_name, industry)
+
+    def _first_match(self, company_hits: AbstractSet[str], company_name: str, industry: str) -> str:
+        industry_hits = self._industry.matches(str(industry).lower() if industry else '')
+        for category, conditions in self._rules:
+            if all(not company_hits.isdisjoint(c.company)
+                   or not industry_hits.isdisjoint(c.industry)
+                   or company_name in c.company_is
+                   or industry in c.industry_is
+                   for c in conditions):
+                return category
+        return self.default
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Company category rules: one ordered table over the Golden Sheet categories
+
+The enrich_batch_N.py scripts each had their own categorize_company
+if/elif chain, and engine.py applied enrich_batch_1's. That chain opens the
+table unchanged and keeps its precedence: every lead it assigned a category
+keeps that category. It could only reach 14 of the 28 Golden
+Sheet categories, though, and sent everything else to its default. The
+rules after it take over from there: brands the other chains knew, then
+LinkedIn industries for every category, then keywords in the company name.
+
+Rules are tried top to bottom and the first one whose conditions all hold
+wins. Keywords inside one When(...) are alternatives, also across company
+and industry; several When(...) in one rule must all hold. Compile the
+table with categorizer.Categorizer.
+"""
+
+from categorizer import Ruleset, When, rule
+
+CATEGORY_RULES = Ruleset(default='Services (Professional and Consumer)', rules=[
+    # enrich_batch_1's chain
+    rule('Food and Beverage', When(industry=['food', 'beverage'])),
+    rule('Pet Food & Care',
+         When(industry=['retail'], company=['petsmart']), When(company=['pet', 'petsmart'])),
+    rule('Retail and E-Commerce', When(industry=['retail'], company=['petsmart'])),
+    rule('Entertainment and Streaming', When(industry=['entertainment'])),
+    rule('Retail and E-Commerce',
+         When(industry=['computer software', 'information technology']), When(company=['amazon'])),
+    rule('Software', When(industry=['computer software', 'information technology'])),
+    rule('Telecommunications', When(industry=['telecommunications'])),
+    rule('Electronics and Technology', When(industry=['consumer electronics'])),
+    rule('Beauty and Personal Care',
+         When(industry=['cosmetics'], company=['estée lauder', 'mac cosmetics'])),
+    rule('Travel, Tourism and Hospitality', When(industry=['travel', 'tourism'], company=['viator'])),
+    rule('Automotive', When(industry=['automotive'], company=['ford'])),
+    rule('QSR (Quick Service Restaurants)', When(industry=['restaurant'])),
+    rule('Electronics and Technology', When(company=['philips'])),
+    rule('Health, Wellness, and Fitness', When(industry=['hospital', 'health care'])),
+    rule('Fashion and Accessories', When(company=['nike'])),
+    rule('Entertainment and Streaming', When(company=['disney'])),
+    rule('Electronics and Technology', When(company=['apple', 'samsung'])),
+    rule('Electronics and Technology', When(industry=['electrical', 'electronic manufacturing'])),
+    rule('Services (Professional and Consumer)', When(industry=['marketing', 'advertising'])),
+    rule('Retail and E-Commerce', When(company=['ebay'])),
+
+    # Brands the other enrich_batch_N chains categorized
+    rule('Fashion and Accessories',
+         When(company=['adidas', 'under armour', 'reebok', 'puma', 'hugo boss', 'zara'])),
+    rule('Retail and E-Commerce', When(company=['amazon', 'sainsbury', 'walmart', 'wayfair', 'asos', 'argos'])),
+    rule('QSR (Quick Service Restaurants)',
+         When(company=['burger king', 'mcdonald', 'kfc', 'starbucks', 'tim hortons'])),
+    rule('Food and Beverage', When(company=['coca-cola', 'coca cola', 'coke', 'pepsi', 'bodyarmor'])),
+    rule('Telecommunications', When(company=['t-mobile', 'verizon', 'at&t', 'vodafone'])),
+    rule('Entertainment and Streaming',
+         When(company=['netflix', 'hulu', 'paramount', 'hbo', 'spotify', 'directv', 'prime video'])),
+    rule('Software', When(company=['amazon web services', 'azure', 'google cloud', 'salesforce', 'oracle',
+                                   'adobe', 'shopify', 'mozilla'])),
+    rule('Electronics and Technology', When(company=['microsoft', 'google', 'sony', 'dyson', 'sharkninja'])),
+    rule('Automotive', When(company=['jeep', 'tesla', 'toyota', 'honda', 'bmw', 'waymo'])),
+    rule('Beauty and Personal Care',
+         When(company=['estée lauder', 'estee lauder', 'clinique', 'loreal', "l'oréal", 'sephora', 'ulta beauty',
+                       'bobbi brown', 'la mer'])),
+    rule('Travel, Tourism and Hospitality', When(company=['jet2', 'airways', 'airlines', 'expedia'])),
+    rule('Home and Garden', When(company=['ikea', 'home depot'])),
+
+    # LinkedIn industries
+    rule('FDI (Foreign Direct Investment)', When(industry=['international trade'])),
+    rule('Luxury Brands', When(industry=['luxury'])),
+    rule('Fashion and Accessories', When(industry=['apparel', 'fashion', 'footwear'])),
+    rule('Alcohol, Liquor & Spirits', When(industry=['wine', 'spirits', 'brewing', 'alcohol'])),
+    rule('Insurance Services', When(industry=['insurance'])),
+    rule('Finance and Banking',
+         When(industry=['banking', 'financial services', 'investment', 'capital markets', 'venture capital'])),
+    rule('Health, Wellness, and Fitness',
+         When(industry=['health', 'wellness', 'fitness', 'medical', 'pharmaceutical'])),
+    rule('Travel, Tourism and Hospitality',
+         When(industry=['travel', 'tourism', 'leisure', 'airline', 'hospitality'])),
+    rule('Home and Garden', When(industry=['furniture', 'home improvement', 'garden'])),
+    rule('Consumer Goods (FMCG/CPG)', When(industry=['consumer goods', 'packaged goods', 'household'])),
+    rule('Business Technology',
+         When(industry=['computer hardware', 'computer networking', 'network security', 'business supplies'])),
+    rule('Childcare & Parenting', When(industry=['child care', 'childcare'])),
+    rule('Charities, Foundations & NGOs',
+         When(industry=['non-profit', 'nonprofit', 'philanthropy', 'civic & social', 'fund-raising'])),
+    rule('Education and Training', When(industry=['education', 'e-learning'])),
+    rule('Government and Public Service',
+         When(industry=['government', 'public policy', 'military', 'law enforcement', 'public safety'])),
+    rule('Conglomerates', When(industry=['conglomerate'])),
+    rule('Energy & Utilities', When(industry=['energy', 'utilities', 'renewables'])),
+    rule('Telecommunications', When(industry=['telecommunication', 'wireless'])),
+    rule('Software', When(industry=['software'])),
+    rule('Electronics and Technology', When(industry=['electronics', 'semiconductors', 'technology'])),
+    rule('Retail and E-Commerce', When(industry=['retail', 'e-commerce', 'supermarkets', 'wholesale'])),
+    rule('Entertainment and Streaming',
+         When(industry=['music', 'broadcast media', 'motion pictures', 'film', 'computer games', 'online media',
+                        'media production'])),
+    rule('Pet Food & Care', When(industry=['veterinary'])),
+    rule('Consumer Goods (FMCG/CPG)', When(industry=['manufacturing'])),
+    rule('Services (Professional and Consumer)',
+         When(industry=['marketing', 'advertising', 'market research', 'consulting', 'legal', 'staffing',
+                        'accounting', 'public relations', 'design', 'publishing'])),
+
+    # Keywords in the company name
+    rule('FDI (Foreign Direct Investment)', When(company=['invest in', 'investment promotion'])),
+    rule('Luxury Brands', When(company=['luxury'])),
+    rule('Alcohol, Liquor & Spirits', When(company=['brewing', 'brewery', 'distiller', 'winery', 'wines'])),
+    rule('Insurance Services', When(company=['insurance', 'assurance'])),
+    rule('Finance and Banking', When(company=['bank', 'finance', 'financial'])),
+    rule('Automotive', When(company=['motor', 'automotive'])),
+    rule('Telecommunications', When(company=['telecom', 'wireless'])),
+    rule('Entertainment and Streaming', When(company=['entertainment', 'streaming', 'studios'])),
+    rule('QSR (Quick Service Restaurants)', When(company=['restaurant', 'burger', 'pizza'])),
+    rule('Food and Beverage', When(company=['food', 'beverage', 'drinks'])),
+    rule('Software', When(company=['software', 'saas'])),
+    rule('Business Technology', When(company=['it services', 'it solutions', 'cybersecurity'])),
+    rule('Health, Wellness, and Fitness', When(company=['health', 'medical', 'hospital', 'fitness', 'pharma'])),
+    rule('Childcare & Parenting', When(company=['childcare', 'nursery', 'parenting'])),
+    rule('Education and Training', When(company=['school', 'university', 'college', 'academy', 'education'])),
+    rule('Government and Public Service', When(company=['government', 'ministry', 'department for', 'council'])),
+    rule('Charities, Foundations & NGOs', When(company=['foundation', 'charity', 'charitable'])),
+    rule('Energy & Utilities', When(company=['energy', 'utilities', 'petroleum'])),
+    rule('Conglomerates', When(company=['conglomerate'])),
+    rule('Travel, Tourism and Hospitality', When(company=['travel', 'hotel', 'resort', 'cruise'])),
+    rule('Home and Garden', When(company=['furniture', 'garden'])),
+    rule('Consumer Goods (FMCG/CPG)', When(company=['consumer goods', 'fmcg', 'household'])),
+    rule('Fashion and Accessories', When(company=['fashion', 'apparel', 'clothing', 'jewel'])),
+    rule('Electronics and Technology', When(company=['electronics'])),
+    rule('Retail and E-Commerce', When(company=['retail', 'stores', 'supermarket'])),
+])
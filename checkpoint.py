@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Atomic chunk outputs and a completion journal for resumable runs
+
+A stage writes each chunk's output to a temporary file and renames it into
+place only once it is complete, so a crash never leaves a half-written file
+behind. After the rename, a line is appended to the journal with the chunk's
+key, row count and the SHA-256 of its files. A restarted run looks every
+chunk up in the journal and skips those whose files are still there with
+the recorded hashes, so a run interrupted at 90% only redoes the rest.
+
+Chunk keys are content hashes of what a chunk was computed from (the export
+hash, its byte ranges and the rules used), so a journal entry can never be
+mistaken for the output of different inputs.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional, Sequence
+
+from match_cache import file_hash
+
+JOURNAL_FILE = "run_journal.jsonl"
+
+
+def content_key(*parts) -> str:
+    """SHA-256 of JSON-serializable parts"""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+@contextmanager
+def atomic_open(filepath: str, mode: str = 'w', **kwargs):
+    """open() for writing into filepath.tmp, renamed over filepath on success
+
+    The data is fsynced before the rename. If the block raises, the
+    temporary file is removed and filepath is left untouched.
+    """
+    tmp_path = f"{filepath}.tmp"
+    f = open(tmp_path, mode, **kwargs)
+    try:
+        yield f
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        f.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def concat_csv(parts: Sequence[str], filepath: str) -> None:
+    """Atomically write the CSV files parts into one, keeping only the first header"""
+    with atomic_open(filepath, 'wb') as out:
+        for i, part in enumerate(parts):
+            with open(part, 'rb') as f:
+                header = f.readline()
+                if i == 0:
+                    out.write(header)
+                shutil.copyfileobj(f, out)
+
+
+class Journal:
+    """Append-only JSON-lines log of completed chunks
+
+    Each entry has the chunk's 'key', its output 'files' (path -> SHA-256)
+    and whatever else the stage records (row counts, ...). A last line torn
+    by a crash mid-append is cut off on load.
+    """
+
+    def __init__(self, path: str = JOURNAL_FILE):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        if not os.path.exists(path):
+            return
+        with open(path, 'rb+') as f:
+            data = f.read()
+            end = data.rfind(b'\n') + 1
+            if end < len(data):
+                f.truncate(end)
+        for line in data[:end].splitlines():
+            entry = json.loads(line)
+            self.entries[entry['key']] = entry
+
+    def finished(self, key: str) -> Optional[Dict]:
+        """Journal entry of a completed chunk whose files are intact, else None"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        for filepath, digest in entry['files'].items():
+            if not os.path.exists(filepath) or file_hash(filepath) != digest:
+                return None
+        return entry
+
+    def record(self, key: str, files: Iterable[str], **fields) -> Dict:
+        """Journal a chunk whose output files are complete, hashing them now"""
+        entry = dict(fields, key=key, files={filepath: file_hash(filepath) for filepath in files})
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.entries[key] = entry
+        return entry
+
+    def prune(self, keep: Iterable[str]) -> None:
+        """Drop every entry whose key is not in keep, deleting its files unless a kept entry shares them"""
+        keep = set(keep)
+        kept_files = {filepath for key in keep if key in self.entries for filepath in self.entries[key]['files']}
+        for key, entry in self.entries.items():
+            if key not in keep:
+                for filepath in entry['files']:
+                    if filepath not in kept_files and os.path.exists(filepath):
+                        os.remove(filepath)
+        self.entries = {key: entry for key, entry in self.entries.items() if key in keep}
+        with atomic_open(self.path, 'w', encoding='utf-8') as f:
+            for entry in self.entries.values():
+                f.write(json.dumps(entry) + '\n')
@@ -7,6 +7,9 @@ import csv
 import os
 from pathlib import Path
 
+from lead_manifest import planned_batches
+from score_stats import ScoreStats
+
 # Configuration
 SCORED_DIR = Path("scored_results")
 FINAL_OUTPUT = "Leads_Final_Enriched_and_Scored.csv"
@@ -18,8 +21,17 @@ def consolidate_results():
     print("CONSOLIDATING SCORED RESULTS")
     print("=" * 80)
 
-    # Find all scored batch files
-    batch_files = sorted(SCORED_DIR.glob("scored_batch_*.csv"))
+    # Scored files of the planned batches (every one present without a plan);
+    # a replan with fewer batches leaves the higher-numbered files behind
+    planned = planned_batches()
+    if planned is None:
+        batch_files = sorted(SCORED_DIR.glob("scored_batch_*.csv"))
+    else:
+        batch_files = [SCORED_DIR / f"scored_batch_{n}.csv" for n in planned]
+        missing = [f.name for f in batch_files if not f.exists()]
+        if missing:
+            print(f"WARNING: planned batches not scored yet: {', '.join(missing)}")
+            batch_files = [f for f in batch_files if f.exists()]
 
     if not batch_files:
         print("ERROR: No scored batch files found!")
@@ -30,12 +42,11 @@ def consolidate_results():
         size_kb = f.stat().st_size / 1024
         print(f"  - {f.name} ({size_kb:.1f} KB)")
 
-    # Read all batches and collect all unique headers
-    all_leads = []
+    # Collect all unique headers (only the header lines are read here)
     all_headers = set()
     stats = {
         'total_leads': 0,
-        'scores': [],
+        'scores': ScoreStats(),
         'in_golden_sheet': 0,
         'categories': {},
         'companies': {}
@@ -43,71 +54,58 @@ def consolidate_results():
 
     for batch_file in batch_files:
         with open(batch_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-
-            # Collect all headers across all files
-            all_headers.update(reader.fieldnames)
-
-            # Read all rows
-            batch_leads = list(reader)
-            all_leads.extend(batch_leads)
+            all_headers.update(next(csv.reader(f), []))
 
     # Convert headers set to sorted list for consistency
     headers = sorted(all_headers)
 
-    # Re-read all batches with standardized headers
-    all_leads = []
-    for batch_file in batch_files:
-        with open(batch_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            batch_leads = list(reader)
-            all_leads.extend(batch_leads)
-
-            # Collect statistics
-            for lead in batch_leads:
-                stats['total_leads'] += 1
-
-                # Score distribution
-                try:
-                    score = float(lead.get('icp_score', 0))
-                    stats['scores'].append(score)
-                except:
-                    pass
-
-                # Golden sheet count
-                if lead.get('brand_in_golden_sheet', '').lower() == 'yes':
-                    stats['in_golden_sheet'] += 1
-
-                # Category distribution
-                category = lead.get('company_category', 'Unknown')
-                stats['categories'][category] = stats['categories'].get(category, 0) + 1
-
-                # Company distribution
-                company = lead.get('font-qanelas 8', 'Unknown')  # Company name column
-                stats['companies'][company] = stats['companies'].get(company, 0) + 1
-
-    # Write consolidated file
+    # Stream every batch into the consolidated file, one lead at a time
     print(f"\n[1/3] Writing consolidated file...")
-    with open(FINAL_OUTPUT, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
+    with open(FINAL_OUTPUT, 'w', encoding='utf-8', newline='') as out:
+        writer = csv.DictWriter(out, fieldnames=headers)
         writer.writeheader()
-        writer.writerows(all_leads)
+
+        for batch_file in batch_files:
+            with open(batch_file, 'r', encoding='utf-8') as f:
+                for lead in csv.DictReader(f):
+                    writer.writerow(lead)
+                    stats['total_leads'] += 1
+
+                    # Score distribution
+                    try:
+                        stats['scores'].add(float(lead.get('icp_score', 0)))
+                    except:
+                        pass
+
+                    # Golden sheet count
+                    if lead.get('brand_in_golden_sheet', '').lower() == 'yes':
+                        stats['in_golden_sheet'] += 1
+
+                    # Category distribution
+                    category = lead.get('company_category', 'Unknown')
+                    stats['categories'][category] = stats['categories'].get(category, 0) + 1
+
+                    # Company distribution
+                    company = lead.get('font-qanelas 8', 'Unknown')  # Company name column
+                    stats['companies'][company] = stats['companies'].get(company, 0) + 1
 
     file_size = Path(FINAL_OUTPUT).stat().st_size / 1024
     print(f"  ✓ Wrote {stats['total_leads']} leads to {FINAL_OUTPUT} ({file_size:.1f} KB)")
 
-    # Calculate statistics
+    print_statistics(stats, FINAL_OUTPUT)
+
+def print_statistics(stats, output=FINAL_OUTPUT):
+    """Print the final statistics of consolidated leads (a dict as consolidate_results builds)"""
     print(f"\n[2/3] Calculating statistics...")
     scores = stats['scores']
-    scores.sort(reverse=True)
 
     score_dist = {
-        '9.0-10.0': sum(1 for s in scores if s >= 9.0),
-        '8.0-8.9': sum(1 for s in scores if 8.0 <= s < 9.0),
-        '7.0-7.9': sum(1 for s in scores if 7.0 <= s < 8.0),
-        '6.0-6.9': sum(1 for s in scores if 6.0 <= s < 7.0),
-        '5.0-5.9': sum(1 for s in scores if 5.0 <= s < 6.0),
-        '<5.0': sum(1 for s in scores if s < 5.0),
+        '9.0-10.0': scores.between(9.0),
+        '8.0-8.9': scores.between(8.0, 9.0),
+        '7.0-7.9': scores.between(7.0, 8.0),
+        '6.0-6.9': scores.between(6.0, 7.0),
+        '5.0-5.9': scores.between(5.0, 6.0),
+        '<5.0': scores.between(high=5.0),
     }
 
     # Print statistics
@@ -126,10 +124,10 @@ def consolidate_results():
         print(f"  {range_name}: {count:3d} leads ({pct:5.1f}%) {bar}")
 
     print(f"\n📈 SCORE STATISTICS:")
-    print(f"  Average: {sum(scores)/len(scores):.2f}")
-    print(f"  Median: {scores[len(scores)//2]:.2f}")
-    print(f"  Highest: {max(scores):.2f}")
-    print(f"  Lowest: {min(scores):.2f}")
+    print(f"  Average: {scores.mean():.2f}")
+    print(f"  Median: {scores.median():.2f}")
+    print(f"  Highest: {scores.max():.2f}")
+    print(f"  Lowest: {scores.min():.2f}")
 
     print(f"\n🏆 TOP 10 COMPANIES BY LEAD COUNT:")
     top_companies = sorted(stats['companies'].items(), key=lambda x: x[1], reverse=True)[:10]
@@ -145,7 +143,7 @@ def consolidate_results():
     print("\n" + "=" * 80)
     print("✅ CONSOLIDATION COMPLETE!")
     print("=" * 80)
-    print(f"\nFinal output: {FINAL_OUTPUT}")
+    print(f"\nFinal output: {output}")
     print(f"All {stats['total_leads']} leads enriched and scored!")
 
 if __name__ == "__main__":
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Enrichment and scoring engine
+
+One importable module for the rule-based pipeline that the per-batch
+enrich_batch_N.py, score_leads.py and score_batch_5.py scripts used to run:
+    enrich(leads, golden_sheet)  Golden Sheet columns and company category
+    score(leads, ruleset)        icp_score and score_reasoning
+Both take any iterable of lead dicts, one batch or the whole export, and
+lazily yield new dicts with the columns added, so rows stream from the
+export reader through enrichment and scoring to the CSV writers and peak
+memory is the reference data, one CHUNK_SIZE chunk of leads and memo caches
+of at most MEMO_SIZE companies, however large the export. Compiled
+categorizers and scorers, and the companies resolved most recently, are kept
+per process, so running all batches in one interpreter loads the reference
+data once and matches each company once while it stays in the memo.
+
+Every batch is matched the same way: COMPANY_ALIASES first, then the
+BRAND_VARIANTS automaton (e.g. ディズニー, 삼성), then bulk_match's exact /
+contains / fuzzy match table over the unique companies. Companies are
+categorized by the one category table in category_rules.py; scoring rules
+are picked by name from scoring_rules.py.
+
+Usage:
+    python engine.py          every agent_batches/enrichment_batch_N.json batch manifest
+    python engine.py 3 5      batches 3 and 5 only
+    python engine.py --all    the whole lead export in one pass
+"""
+
+import argparse
+import csv
+import os
+import re
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from aho_corasick import AhoCorasick
+from bulk_match import FUZZY_THRESHOLD, MIN_CONTAINED, enrichment_columns, match_table
+from categorizer import Categorizer
+from category_rules import CATEGORY_RULES
+from golden_sheet import CATEGORY_FILE, PIVOT_FILE, SNAPSHOT_FILE, Brand, GoldenSheet, load_golden_sheet
+from industry_categories import INDUSTRY_CATEGORIES_FILE, load_industries
+from lead_manifest import load_manifest, manifest_leads, planned_batches
+from market_codes import country_code
+from match_cache import CACHE_FILE, MatchCache
+from name_normalization import normalize_name
+from scorer import Scorer
+from scoring_rules import SCORING_RULESETS
+from stage_cache import MATCHING_MODULES, version
+
+# Configuration
+LEADS_FILE = "Exports_Leads_BrandManager.csv"
+BATCH_DIR = "agent_batches"
+ENRICHED_DIR = "enriched_results"
+SCORED_DIR = "scored_results"
+DEFAULT_SCORING = 'score_leads'
+MATCHER = 'engine'
+CHUNK_SIZE = 1000  # leads matched per bulk match table
+MEMO_SIZE = 100_000  # resolved companies and categorized (company, industry) pairs kept per process
+
+COMPANY_COLUMN = 'inline-flex'
+# Shifted exports move the industry from `font-qanelas 14` to `font-qanelas 13`
+INDUSTRY_COLUMNS = ('font-qanelas 14', 'font-qanelas 13')
+
+ENRICHMENT_FIELDS = ['brand_in_golden_sheet', 'total_assets_tested', 'platforms_tested', 'platform_breakdown',
+                     'markets_tested', 'brand_in_lead_market', 'company_category', 'category_asset_count']
+SCORE_FIELDS = ['icp_score', 'score_reasoning']
+
+# Companies whose LinkedIn name does not match their Golden Sheet brand,
+# keyed by normalized company name
+COMPANY_ALIASES = {normalize_name(company): brand for company, brand in {
+    'Amazon Web Services': 'AWS',
+    'Amazon Web Services (AWS)': 'AWS',
+    'Amazon Business': 'Amazon',
+    'Amazon MGM Studios': 'Amazon',
+    'Prime Video': 'Amazon',
+    'Prime Video & Amazon MGM Studios': 'Amazon',
+    'T Mobile': 'T-Mobile',
+    'TMobile': 'T-Mobile',
+    'SharkNinja': 'NINJA',
+    'CocaCola': 'Coca Cola',
+    'Coke': 'Coca Cola',
+    'The Coca-Cola Company': 'Coca Cola',
+    'The Walt Disney Company': 'Disney',
+    'The Estée Lauder Companies Inc.': 'Estée Lauder',
+    'Ford Motor Company': 'Ford',
+    'Samsung Electronics': 'Samsung',
+    'Mozilla': 'Mozilla Firefox',
+}.items()}
+
+# Variants of Golden Sheet brands (other scripts, nicknames) as whole words of a company name
+BRAND_VARIANTS = {
+    'Apple': ['apple', 'アップル'],
+    'Disney': ['disney', 'ディズニー'],
+    'Coca Cola': ['coca cola', 'coca-cola', 'coke', 'コカコーラ'],
+    'Samsung': ['samsung', '삼성'],
+    'Nike': ['nike', 'ナイキ'],
+    'Amazon': ['amazon', 'amazon_prime', 'prime video and amazon mgm studios', 'prime video'],
+    'Ford': ['ford', 'フォード'],
+    'T-Mobile': ['t-mobile', 'tmobile', 'metro by t-mobile'],
+}
+# Every variant in one automaton, tagged (length, brand) so the longest hit wins
+VARIANT_MATCHER = AhoCorasick((normalize_name(variant), (len(normalize_name(variant)), brand))
+                              for brand, variants in BRAND_VARIANTS.items() for variant in variants)
+
+DATE = re.compile(r'\d+/\d+/\d+')
+
+# Normalized company -> matched brand name (None = no match), per Golden Sheet,
+# least recently used first and capped at MEMO_SIZE companies
+_MATCHES: Dict[tuple, 'OrderedDict[str, Optional[str]]'] = {}
+
+
+def read_leads(filepath: str = LEADS_FILE) -> Iterator[Dict[str, str]]:
+    """Rows of a lead export CSV, one at a time"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        yield from csv.DictReader(f)
+
+
+def chunked(rows: Iterable, size: int = CHUNK_SIZE) -> Iterator[list]:
+    """Consecutive lists of up to size rows"""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def company_name(lead: Mapping[str, str]) -> str:
+    return (lead.get(COMPANY_COLUMN) or '').strip()
+
+
+@lru_cache(maxsize=None)
+def industry_vocabulary() -> frozenset:
+    """Industries of the lookup table (industry_categories.py)"""
+    return frozenset(load_industries(INDUSTRY_CATEGORIES_FILE))
+
+
+def lead_industry(lead: Mapping[str, str]) -> str:
+    """Industry of a lead, skipping dates and locations in shifted exports
+
+    Known industries are taken as they are, so ones with a comma ("Health,
+    Wellness & Fitness") are not mistaken for locations.
+    """
+    for column in INDUSTRY_COLUMNS:
+        value = (lead.get(column) or '').strip()
+        if value in industry_vocabulary():
+            return value
+        if value and value != '-' and not DATE.match(value) and not country_code(value):
+            return value
+    return ''
+
+
+@lru_cache(maxsize=None)
+def categorizer() -> Categorizer:
+    """Compiled category table, built once per process"""
+    return Categorizer(CATEGORY_RULES, industry_vocabulary())
+
+
+@lru_cache(maxsize=None)
+def scorer(ruleset: str = DEFAULT_SCORING) -> Scorer:
+    """Scoring ruleset, built once per process"""
+    return Scorer(SCORING_RULESETS[ruleset])
+
+
+def variant_brand(company: str, golden_sheet: GoldenSheet) -> Optional[str]:
+    """Golden Sheet brand of the longest BRAND_VARIANTS variant in a normalized company, if any"""
+    hits = [hit for _, hit in VARIANT_MATCHER.words(company) if hit[1] in golden_sheet.by_name]
+    return max(hits)[1] if hits else None
+
+
+def matcher_key() -> str:
+    """MatchCache key of this matcher: MATCHER at the version of the matching modules
+
+    Editing a matching rule (a threshold, an alias, the normalizer) changes
+    the key, so no company is served a match made under the old rules.
+    """
+    return f"{MATCHER}@{version(*MATCHING_MODULES)}"
+
+
+def match_companies(companies: Iterable[str], golden_sheet: GoldenSheet,
+                    match_cache: Optional[MatchCache] = None) -> Dict[str, Optional[Brand]]:
+    """Brand (or None) for each normalized company name
+
+    Companies still in this process's memo, or found in match_cache, are
+    not matched again; the rest go through COMPANY_ALIASES, then (unless the
+    company is a brand itself) BRAND_VARIANTS, then one bulk match table.
+    """
+    memo = _MATCHES.setdefault(golden_sheet.key, OrderedDict())
+    unique = set(companies)
+    resolved = {company: memo[company] for company in unique if company in memo}
+
+    brand_index = golden_sheet.brand_index
+    todo = []
+    for company in unique - resolved.keys():
+        cached = match_cache.get(company) if match_cache else None
+        if cached is not None:
+            resolved[company] = cached[0]
+            continue
+        alias = COMPANY_ALIASES.get(company)
+        if alias not in golden_sheet.by_name and brand_index.lookup(company) is None:
+            alias = variant_brand(company, golden_sheet)
+        if alias in golden_sheet.by_name:
+            resolved[company] = alias
+            if match_cache:
+                match_cache.put(company, alias)
+        else:
+            todo.append(company)
+
+    for company in todo:
+        resolved[company] = None
+    for company, (pos, _) in match_table(todo, brand_index, FUZZY_THRESHOLD, MIN_CONTAINED).items():
+        resolved[company] = brand_index.brands[pos].name if pos is not None else None
+    if match_cache:
+        for company in todo:
+            match_cache.put(company, resolved[company])
+        match_cache.commit()
+
+    for company in unique:
+        memo[company] = resolved[company]
+        memo.move_to_end(company)
+    while len(memo) > MEMO_SIZE:
+        memo.popitem(last=False)
+
+    return {company: golden_sheet.by_name.get(resolved[company]) if resolved[company] else None
+            for company in unique}
+
+
+def enrich(leads: Iterable[Mapping[str, str]], golden_sheet: GoldenSheet, match_cache: Optional[MatchCache] = None,
+           chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, str]]:
+    """Leads with ENRICHMENT_FIELDS added
+
+    Leads are matched chunk_size at a time: the companies of a chunk that no
+    earlier chunk resolved go through one bulk match table.
+    """
+    categorize = categorizer()
+
+    # Leads repeat companies heavily: categorize each recent (company, industry) pair once
+    categorize_pair = lru_cache(maxsize=MEMO_SIZE)(categorize.categorize)
+    for chunk in chunked(leads, chunk_size):
+        brands = match_companies((normalize_name(company_name(lead)) for lead in chunk), golden_sheet,
+                                 match_cache)
+        for lead in chunk:
+            company = company_name(lead)
+            brand = brands[normalize_name(company)]
+
+            row = dict(lead)
+            row.update(enrichment_columns(brand, golden_sheet.platform_matrix))
+            row['brand_in_lead_market'] = ('Yes' if golden_sheet.in_lead_market(brand, lead) else 'No') if brand else ''
+
+            category = categorize_pair(company, lead_industry(lead))
+            row['company_category'] = category
+            row['category_asset_count'] = str(golden_sheet.category_assets.get(category, 0))
+            yield row
+
+
+def score(leads: Iterable[Mapping[str, str]], ruleset: str = DEFAULT_SCORING) -> Iterator[Dict[str, str]]:
+    """Enriched leads with SCORE_FIELDS added"""
+    rules = scorer(ruleset)
+    for lead in leads:
+        scores = rules.score(lead)
+        row = dict(lead)
+        row['icp_score'] = str(scores.total)
+        row['score_reasoning'] = rules.reasoning(lead, scores)
+        yield row
+
+
+class ResultWriter:
+    """enriched_{name}.csv and scored_{name}.csv, written one scored lead at a time
+
+    Scored leads carry every enrichment column, so one row feeds both files.
+    counts tracks leads, leads matched to the Golden Sheet, leads scored 8.0+
+    and distinct companies ('leads', 'matched', 'hot', 'companies'), whose
+    brand is looked up once each. Rows go to .tmp files that close()
+    renames into place, so a run that dies midway leaves no partial output.
+    """
+
+    def __init__(self, name: str, columns: Sequence[str], enriched_dir: str = ENRICHED_DIR,
+                 scored_dir: str = SCORED_DIR):
+        self.name = name
+        self.counts = Counter()
+        self._companies = set()
+        os.makedirs(enriched_dir, exist_ok=True)
+        os.makedirs(scored_dir, exist_ok=True)
+        self.paths = [os.path.join(enriched_dir, f"enriched_{name}.csv"),
+                      os.path.join(scored_dir, f"scored_{name}.csv")]
+        self._files = [open(f"{path}.tmp", 'w', newline='', encoding='utf-8') for path in self.paths]
+        self._writers = [
+            csv.DictWriter(self._files[0], fieldnames=list(columns) + ENRICHMENT_FIELDS, extrasaction='ignore'),
+            csv.DictWriter(self._files[1], fieldnames=list(columns) + ENRICHMENT_FIELDS + SCORE_FIELDS),
+        ]
+        for writer in self._writers:
+            writer.writeheader()
+
+    def write(self, lead: Mapping[str, str]):
+        for writer in self._writers:
+            writer.writerow(lead)
+        self.counts['leads'] += 1
+        self.counts['matched'] += lead['brand_in_golden_sheet'] == 'Yes'
+        self.counts['hot'] += float(lead['icp_score']) >= 8
+        self._companies.add(normalize_name(company_name(lead)))
+        self.counts['companies'] = len(self._companies)
+
+    def close(self):
+        """Move the finished files into place"""
+        for f, path in zip(self._files, self.paths):
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+            os.replace(f.name, path)
+
+    def discard(self):
+        """Drop the unfinished files"""
+        for f in self._files:
+            f.close()
+            os.remove(f.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def run(name: str, leads: Iterable[Dict[str, str]], golden_sheet: GoldenSheet,
+        match_cache: Optional[MatchCache] = None, scoring: str = DEFAULT_SCORING) -> Counter:
+    """Stream leads through enrich and score into enriched_{name}.csv / scored_{name}.csv
+
+    Returns the ResultWriter counts.
+    """
+    leads = iter(leads)
+    first = next(leads, None)
+    if first is None:
+        return Counter()
+
+    with ResultWriter(name, list(first)) as writer:
+        for lead in score(enrich(chain([first], leads), golden_sheet, match_cache), scoring):
+            writer.write(lead)
+    return writer.counts
+
+
+def rescore(name: str, scoring: str = DEFAULT_SCORING) -> Counter:
+    """Score enriched_{name}.csv again into scored_{name}.csv, without enriching it again
+
+    Returns the ResultWriter counts.
+    """
+    enriched = os.path.join(ENRICHED_DIR, f"enriched_{name}.csv")
+    with open(enriched, 'r', encoding='utf-8') as f:
+        columns = [column for column in next(csv.reader(f)) if column not in ENRICHMENT_FIELDS]
+    with ResultWriter(name, columns) as writer:
+        for lead in score(read_leads(enriched), scoring):
+            writer.write(lead)
+    return writer.counts
+
+
+def summary(name: str, counts: Counter) -> str:
+    """One-line report of a run() result"""
+    return f"{name}: {counts['leads']} leads, {counts['matched']} in Golden Sheet, {counts['hot']} scored 8.0+"
+
+
+def reduction(counts: Counter) -> str:
+    """Distinct companies of run() results against their leads (counted once per run)"""
+    companies = counts['companies']
+    return (f"Unique companies resolved: {companies} "
+            f"({counts['leads'] / max(companies, 1):.1f}x fewer brand lookups than leads)")
+
+
+def run_batch(filepath: str, golden_sheet: GoldenSheet, match_cache: Optional[MatchCache] = None,
+              scoring: str = DEFAULT_SCORING) -> Tuple[str, Counter]:
+    """run() over one agent_batches/enrichment_batch_N.json manifest, named batch_N
+
+    Batch files that still hold a JSON copy of their leads are read as is.
+    """
+    batch = load_manifest(filepath)
+    leads = batch['leads'] if 'leads' in batch else manifest_leads(batch)
+    name = f"batch_{batch['batch_num']}"
+    return name, run(name, leads, golden_sheet, match_cache, scoring)
+
+
+def batch_files(numbers: Sequence[int]) -> List[str]:
+    """agent_batches/enrichment_batch_N.json files, every planned batch if numbers is empty
+
+    Without a batch plan, every batch file present is taken.
+    """
+    numbers = numbers or planned_batches()
+    if numbers:
+        return [os.path.join(BATCH_DIR, f"enrichment_batch_{n}.json") for n in numbers]
+    names = [name for name in os.listdir(BATCH_DIR) if re.fullmatch(r'enrichment_batch_\d+\.json', name)]
+    return [os.path.join(BATCH_DIR, name) for name in sorted(names, key=lambda n: int(re.sub(r'\D', '', n)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enrich and score leads in one process")
+    parser.add_argument('batches', nargs='*', type=int, help="batch numbers (default: every planned batch)")
+    parser.add_argument('--all', action='store_true', help=f"process the whole {LEADS_FILE} instead")
+    parser.add_argument('--scoring', default=DEFAULT_SCORING, choices=sorted(SCORING_RULESETS))
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("LEAD ENRICHMENT AND SCORING")
+    print("=" * 80)
+
+    sheet = load_golden_sheet(PIVOT_FILE, CATEGORY_FILE, snapshot=SNAPSHOT_FILE)
+    match_cache = MatchCache(PIVOT_FILE, matcher_key(), path=CACHE_FILE)
+    print(f"\nLoaded {len(sheet.brands)} brands and {len(sheet.categories)} categories\n")
+
+    total = Counter()
+    if args.all:
+        total = run('leads', read_leads(LEADS_FILE), sheet, match_cache, args.scoring)
+        print(f"  {summary('leads', total)}")
+    else:
+        for filepath in batch_files(args.batches):
+            name, counts = run_batch(filepath, sheet, match_cache, args.scoring)
+            print(f"  {summary(name, counts)}")
+            total.update(counts)
+
+    match_cache.close()
+    print(f"\n{reduction(total)}")
+    print(match_cache.summary())
+    print(f"Output saved to: {ENRICHED_DIR}/ and {SCORED_DIR}/")
+
+
+if __name__ == '__main__':
+    main()
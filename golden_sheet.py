@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Golden Sheet loader shared by the engine and matching tools
+
+Parses "Golden Sheet - Pivot Table Brands.csv" (three header/summary rows,
+then one row per brand) and "Golden Sheet - Category_Count.csv" into compact
+typed records, builds the lookup maps enrichment needs, and compiles the
+normalize_name BrandIndex, the brand x platform PlatformMatrix and the
+market code table with each brand's markets as a bitmask. All of it is pickled to a binary
+snapshot keyed by the content hash of both CSVs and of the modules that
+build it (SNAPSHOT_MODULES), so a warm start loads one file instead of
+re-parsing the sheets and rebuilding the index; editing either CSV, the
+normalizer or the index code invalidates the snapshot.
+
+The snapshot is unpickled, and unpickling can run arbitrary code, so it is
+trusted like the modules themselves: it must only ever be written by this
+loader, in a working directory no one else can write to.
+"""
+
+import csv
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from brand_index import BrandIndex
+from market_codes import MarketTable, overlaps
+from match_cache import file_hash
+from name_normalization import normalize_name
+from platform_matrix import PlatformMatrix
+
+PIVOT_FILE = "Golden Sheet - Pivot Table Brands.csv"
+CATEGORY_FILE = "Golden Sheet - Category_Count.csv"
+SNAPSHOT_FILE = "golden_sheet.snapshot"
+SNAPSHOT_VERSION = 3  # bump when the records or the index change shape
+
+# Modules whose code decides what a snapshot holds (normalized names, blocking keys, automaton, ...)
+SNAPSHOT_MODULES = ('golden_sheet.py', 'brand_index.py', 'aho_corasick.py', 'blocking.py', 'similarity.py',
+                    'name_normalization.py', 'platform_matrix.py', 'market_codes.py')
+
+PLATFORMS = ('amazon_prime', 'instagram', 'netflix', 'standalone', 'tiktok', 'youtube_shorts')
+HEADER_ROWS = 3
+SUMMARY_ROWS = {'MAIN BRAND', 'Main Brand', 'Grand Total'}
+
+
+def _split_list(value: str) -> Tuple[str, ...]:
+    return tuple(item.strip() for item in value.split(',') if item.strip())
+
+
+def _to_int(value: str) -> int:
+    try:
+        return int(value) if value.strip() else 0
+    except ValueError:
+        return 0
+
+
+class Brand:
+    """One pivot table row
+
+    platform_counts follow PLATFORMS; platforms and markets are the sheet's
+    platforms_list and markets_list columns; market_mask is markets in the
+    GoldenSheet's MarketTable.
+    """
+    __slots__ = ('name', 'platform_counts', 'total', 'platforms', 'markets', 'market_mask')
+
+    def __init__(self, name: str, platform_counts: Tuple[int, ...], total: int,
+                 platforms: Tuple[str, ...], markets: Tuple[str, ...]):
+        self.name = name
+        self.platform_counts = platform_counts
+        self.total = total
+        self.platforms = platforms
+        self.markets = markets
+        self.market_mask = 0
+
+    def __repr__(self) -> str:
+        return f"Brand({self.name!r}, total={self.total})"
+
+    @property
+    def platforms_list(self) -> str:
+        return ', '.join(self.platforms)
+
+    @property
+    def markets_list(self) -> str:
+        return ', '.join(self.markets)
+
+
+class Category:
+    """One Category_Count row"""
+    __slots__ = ('name', 'assets')
+
+    def __init__(self, name: str, assets: int):
+        self.name = name
+        self.assets = assets
+
+    def __repr__(self) -> str:
+        return f"Category({self.name!r}, assets={self.assets})"
+
+
+class GoldenSheet:
+    """Parsed Golden Sheet with lookup maps and the compiled brand index
+
+    by_name: exact brand name -> Brand
+    category_assets: category name -> number of assets tested
+    brand_index: BrandIndex over brands (normalize_name), positions follow brands
+    platform_matrix: brands x PLATFORMS asset counts, rows follow brands
+    markets: market code table shared by brand and lead masks
+    """
+    __slots__ = ('key', 'brands', 'categories', 'by_name', 'category_assets', 'brand_index',
+                 'platform_matrix', 'markets')
+
+    def __init__(self, key: Tuple, brands: List[Brand], categories: List[Category]):
+        self.key = key
+        self.brands = brands
+        self.categories = categories
+        self.by_name: Dict[str, Brand] = {}
+        for brand in brands:
+            self.by_name.setdefault(brand.name, brand)
+        self.category_assets = {category.name: category.assets for category in categories}
+        self.brand_index = BrandIndex(brands, normalize_name, key=attrgetter('name'))
+        self.platform_matrix = PlatformMatrix([brand.name for brand in brands],
+                                              [brand.platform_counts for brand in brands], PLATFORMS)
+        self.markets = MarketTable()
+        for brand in brands:
+            brand.market_mask = self.markets.mask(brand.markets)
+
+    def in_lead_market(self, brand: Brand, lead: Mapping[str, str]) -> bool:
+        """Whether brand tests in the country of the lead's location"""
+        return overlaps(brand.market_mask, self.markets.lead_mask(lead))
+
+
+def parse_pivot(filepath: str = PIVOT_FILE) -> List[Brand]:
+    """Brand rows of the pivot table, in sheet order, without header/summary rows"""
+    brands = []
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for i, row in enumerate(csv.reader(f)):
+            if i < HEADER_ROWS or len(row) < 9:
+                continue
+            name = row[1].strip()
+            if not name or name in SUMMARY_ROWS:
+                continue
+            brands.append(Brand(
+                name,
+                tuple(_to_int(value) for value in row[2:2 + len(PLATFORMS)]),
+                _to_int(row[8]),
+                _split_list(row[9]) if len(row) > 9 else (),
+                _split_list(row[10]) if len(row) > 10 else (),
+            ))
+    return brands
+
+
+def parse_categories(filepath: str = CATEGORY_FILE) -> List[Category]:
+    """Rows of the category count sheet"""
+    categories = []
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            name = (row.get('Primary Category') or '').strip()
+            if name:
+                categories.append(Category(name, _to_int(row.get('Number of Assets Tested') or '')))
+    return categories
+
+
+@lru_cache(maxsize=None)
+def code_version() -> str:
+    """Content hash of SNAPSHOT_MODULES"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for name in SNAPSHOT_MODULES:
+        digest.update(file_hash(os.path.join(here, name)).encode('ascii'))
+    return digest.hexdigest()
+
+
+def read_snapshot(path: str = SNAPSHOT_FILE) -> Optional[GoldenSheet]:
+    """GoldenSheet stored in a snapshot, whatever CSVs and code it was built from
+
+    None if there is no readable snapshot of the current SNAPSHOT_VERSION.
+    The file is unpickled: only read snapshots this loader wrote.
+    """
+    try:
+        with open(path, 'rb') as f:
+            sheet = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError):
+        return None
+    if not isinstance(sheet, GoldenSheet) or sheet.key[0] != SNAPSHOT_VERSION:
+        return None
+    return sheet
+
+
+def previous_snapshot(path: str = SNAPSHOT_FILE) -> str:
+    """Where write_snapshot keeps the snapshot of the pivot table it replaced"""
+    return f"{path}.previous"
+
+
+def write_snapshot(sheet: GoldenSheet, path: str = SNAPSHOT_FILE):
+    """Snapshot sheet at path
+
+    A snapshot of another pivot table is kept at previous_snapshot(path),
+    so golden_sheet_diff can still carry matches made against it over to
+    the new sheet when a run loaded the refreshed CSVs first.
+    """
+    # Write to a temporary file first so concurrent readers never see half a snapshot
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(sheet, f, protocol=pickle.HIGHEST_PROTOCOL)
+        old = read_snapshot(path)
+        if old is not None and old.key[1] != sheet.key[1]:
+            os.replace(path, previous_snapshot(path))
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_golden_sheet(pivot_file: str = PIVOT_FILE, category_file: str = CATEGORY_FILE,
+                      snapshot: Optional[str] = SNAPSHOT_FILE) -> GoldenSheet:
+    """Golden Sheet from the snapshot if it matches both CSVs, else parsed and re-snapshotted
+
+    Pass snapshot=None to always parse the CSVs.
+    """
+    key = (SNAPSHOT_VERSION, file_hash(pivot_file), file_hash(category_file), code_version())
+    if snapshot:
+        sheet = read_snapshot(snapshot)
+        if sheet is not None and sheet.key == key:
+            return sheet
+
+    sheet = GoldenSheet(key, parse_pivot(pivot_file), parse_categories(category_file))
+    if snapshot:
+        write_snapshot(sheet, snapshot)
+    return sheet
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Incremental refresh after a Golden Sheet update
+
+Compares the Golden Sheet the last enrichment ran against (the snapshot) with
+the refreshed CSVs: brands added, removed, changed (totals, platform counts,
+platforms or markets) or reordered, and categories whose asset counts
+changed. Brand order decides which brand wins when a company name contains
+several, so a brand whose rank among the brands of both sheets moved counts
+as reordered. Cached company matches are then carried over to the new sheet
+unless the change can affect them:
+- the company resolved to a removed brand, or
+- an added or reordered brand is a close candidate for the company or for
+  the brand it resolved to (alias tables map companies onto brand-like
+  names): either name contains the other, they share a token, or their
+  SequenceMatcher ratio reaches CLOSE_RATIO (the loosest fuzzy threshold any
+  matcher uses)
+
+Companies that resolved to a changed brand keep their match, but their leads
+get the brand's new columns. Those companies and the re-matched ones, with
+the changed categories, are written to REFRESH_FILE, so the next
+`orchestrate_agents.py --run` only enriches again the chunks holding one of
+their leads; every other chunk is carried over to the new sheet from the
+journal.
+
+Run it once after replacing the CSVs, ideally before the engine:
+    python golden_sheet_diff.py
+The new sheet is only snapshotted once the matches are carried over. If a
+run already loaded the refreshed CSVs, the snapshot it replaced (kept by
+golden_sheet.write_snapshot) is diffed instead.
+"""
+
+import json
+import os
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from brand_index import tokenize
+from checkpoint import atomic_open
+from golden_sheet import (CATEGORY_FILE, PIVOT_FILE, SNAPSHOT_FILE, GoldenSheet, load_golden_sheet,
+                          previous_snapshot, read_snapshot, write_snapshot)
+from industry_categories import INDUSTRY_CATEGORIES_FILE
+from match_cache import CACHE_FILE, carry_over, file_hash
+from name_normalization import normalize_name
+from stage_cache import GOLDEN_SHEET_FILES, hashes_version, version
+
+CLOSE_RATIO = 0.6
+REFRESH_FILE = "golden_sheet_refresh.json"  # what each refresh changed, for later --runs
+
+
+class SheetDiff(NamedTuple):
+    added: Set[str]
+    removed: Set[str]
+    changed: Set[str]
+    reordered: Set[str]
+    categories: Set[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed or self.reordered or self.categories)
+
+
+def _brand_fields(brand) -> tuple:
+    return brand.platform_counts, brand.total, brand.platforms, brand.markets
+
+
+def diff_sheets(old: GoldenSheet, new: GoldenSheet) -> SheetDiff:
+    """Brands and categories that differ between two Golden Sheets"""
+    old_names, new_names = set(old.by_name), set(new.by_name)
+    common = old_names & new_names
+    changed = {name for name in common
+               if _brand_fields(old.by_name[name]) != _brand_fields(new.by_name[name])}
+    # Both are the common brands in sheet order: a brand whose rank differs was reordered
+    old_order = dict.fromkeys(brand.name for brand in old.brands if brand.name in common)
+    new_order = dict.fromkeys(brand.name for brand in new.brands if brand.name in common)
+    reordered = {name for name, moved in zip(old_order, new_order) if name != moved}
+    categories = {name for name in set(old.category_assets) | set(new.category_assets)
+                  if old.category_assets.get(name) != new.category_assets.get(name)}
+    return SheetDiff(new_names - old_names, old_names - new_names, changed, reordered, categories)
+
+
+class AffectedMatches:
+    """Decides which cached (company, brand) matches a SheetDiff can change"""
+
+    def __init__(self, diff: SheetDiff, new: GoldenSheet):
+        self.removed = diff.removed
+        index = new.brand_index
+        candidates = diff.added | diff.reordered
+        self._candidates = [pos for pos, brand in enumerate(index.brands) if brand.name in candidates]
+        self._index = index
+
+    def close_to_candidate(self, name: str) -> bool:
+        """Whether an added or reordered brand is a close candidate for a company or brand name"""
+        name = normalize_name(name)
+        if not name:
+            return False
+        tokens = set(tokenize(name))
+        for pos in self._candidates:
+            brand = self._index.names[pos]
+            if not brand:
+                continue
+            if name in brand or brand in name or tokens.intersection(tokenize(brand)):
+                return True
+            if self._index.ratio_above(name, pos, CLOSE_RATIO, inclusive=True) is not None:
+                return True
+        return False
+
+    def affected(self, company: str, brand: Optional[str]) -> bool:
+        """Whether the cached match of company (brand None = no match) must be redone"""
+        if brand in self.removed or self.close_to_candidate(company):
+            return True
+        return brand is not None and self.close_to_candidate(brand)
+
+
+def old_sheet(new: GoldenSheet) -> Optional[GoldenSheet]:
+    """Snapshot of the sheet the cached matches were made against
+
+    The current snapshot, unless a run already replaced it with the new
+    pivot table; then the snapshot it replaced.
+    """
+    old = read_snapshot(SNAPSHOT_FILE)
+    if old is not None and old.key[1] == new.key[1]:
+        previous = read_snapshot(previous_snapshot(SNAPSHOT_FILE))
+        if previous is not None and previous.key[1] != new.key[1]:
+            return previous
+    return old
+
+
+def read_refreshes(path: str = REFRESH_FILE) -> List[Dict]:
+    """Consecutive refreshes, oldest first: sheet versions 'from' and 'to', 'companies' and 'categories'"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def write_refresh(old: GoldenSheet, companies: Set[str], categories: Set[str], path: str = REFRESH_FILE):
+    """Record a refresh from old to the current sheet files (versions as stage_cache.version)
+
+    It extends the recorded refreshes if it starts from the sheet the last
+    one ended with, and replaces them otherwise.
+    """
+    sheet_from = hashes_version([old.key[1], old.key[2], file_hash(INDUSTRY_CATEGORIES_FILE)])
+    refreshes = read_refreshes(path)
+    if refreshes and refreshes[-1]['to'] != sheet_from:
+        refreshes = []
+    refreshes.append({'from': sheet_from, 'to': version(*GOLDEN_SHEET_FILES),
+                      'companies': sorted(companies), 'categories': sorted(categories)})
+    with atomic_open(path, 'w', encoding='utf-8') as f:
+        json.dump(refreshes, f)
+
+
+def earlier_sheets(sheet_version: str, path: str = REFRESH_FILE) -> List[Tuple[str, Set[str], Set[str]]]:
+    """(version, companies, categories) of each sheet refreshed into sheet_version, newest first
+
+    companies and categories are everything the refreshes since that sheet
+    affect; leads outside them are enriched the same against both sheets.
+    """
+    companies: Set[str] = set()
+    categories: Set[str] = set()
+    earlier = []
+    for refresh in reversed(read_refreshes(path)):
+        if refresh['to'] != sheet_version:
+            break
+        companies |= set(refresh['companies'])
+        categories |= set(refresh['categories'])
+        sheet_version = refresh['from']
+        earlier.append((sheet_version, set(companies), set(categories)))
+    return earlier
+
+
+def main():
+    # Parsed without touching the snapshot, which is still the old sheet
+    new = load_golden_sheet(PIVOT_FILE, CATEGORY_FILE, snapshot=None)
+    old = old_sheet(new)
+
+    print("=" * 80)
+    print("GOLDEN SHEET REFRESH")
+    print("=" * 80)
+
+    if old is None:
+        write_snapshot(new, SNAPSHOT_FILE)
+        print("\nNo previous snapshot: run engine.py for a full enrichment.")
+        return
+    if old.key == new.key:
+        print("\nGolden Sheet unchanged since the last snapshot.")
+        return
+
+    diff = diff_sheets(old, new)
+    print(f"\nBrands added:   {len(diff.added)}")
+    print(f"Brands removed: {len(diff.removed)}")
+    print(f"Brands changed: {len(diff.changed)}")
+    print(f"Brands reordered: {len(diff.reordered)}")
+    print(f"Categories changed: {len(diff.categories)}")
+    for label, names in (('Added', diff.added), ('Removed', diff.removed), ('Changed', diff.changed),
+                         ('Reordered', diff.reordered), ('Category', diff.categories)):
+        for name in sorted(names):
+            print(f"  {label}: {name}")
+
+    if old.key[1] == new.key[1]:
+        write_refresh(old, set(), diff.categories)
+        write_snapshot(new, SNAPSHOT_FILE)
+        print("\nPivot table unchanged: cached matches stay valid.")
+        print("\nRe-run orchestrate_agents.py --run: only chunks with leads in a changed category are redone.")
+        return
+
+    affected = AffectedMatches(diff, new)
+    redo: Set[str] = set()
+    reread: Set[str] = set()
+
+    def keep(company: str, brand: Optional[str]) -> bool:
+        if affected.affected(company, brand):
+            redo.add(company)
+            return False
+        if brand in diff.changed:
+            reread.add(company)
+        return True
+
+    kept, dropped = carry_over(CACHE_FILE, old.key[1], new.key[1], keep)
+    write_refresh(old, redo | reread, diff.categories)
+    # Only now is the old sheet no longer needed
+    write_snapshot(new, SNAPSHOT_FILE)
+    if os.path.exists(previous_snapshot(SNAPSHOT_FILE)):
+        os.remove(previous_snapshot(SNAPSHOT_FILE))
+    print(f"\nCached matches kept: {kept}")
+    print(f"Cached matches to redo: {dropped}")
+    print(f"Companies affected: {len(redo | reread)} ({len(reread)} only re-read a changed brand)")
+    print("\nRe-run orchestrate_agents.py --run: only chunks with an affected company's leads, or leads")
+    print("in a changed category, are redone; engine.py re-matches only the companies to redo.")
+
+
+if __name__ == "__main__":
+    main()
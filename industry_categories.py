@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Industry -> category lookup table
+
+LinkedIn industries (`font-qanelas 14`: "Computer Software", "Food &
+Beverages", ...) come from a small closed vocabulary, so the category an
+industry gets on its own can be computed once instead of per lead. The
+vocabulary is seeded from the rows already in enriched_results/ and kept
+next to the Golden Sheet as "Golden Sheet - Industry Categories.csv", with
+the category the category table (category_rules.py) assigns it.
+
+Categorizer precomputes its lookup from the vocabulary, so the categories are
+always those of the current category_rules.py; rerun this script after new
+exports only to grow the vocabulary. Usage: python industry_categories.py
+"""
+
+import csv
+import glob
+import os
+from collections import Counter
+from typing import List
+
+from categorizer import Categorizer
+from category_rules import CATEGORY_RULES
+
+INDUSTRY_CATEGORIES_FILE = "Golden Sheet - Industry Categories.csv"
+ENRICHED_DIR = "enriched_results"
+INDUSTRY_COLUMN = "font-qanelas 14"
+
+
+def seed_industries(enriched_dir: str = ENRICHED_DIR) -> Counter:
+    """Lead count per industry across the enriched batch CSVs
+
+    Values without letters (dates that slipped into the column) are not
+    industries and are skipped.
+    """
+    counts = Counter()
+    for filepath in sorted(glob.glob(os.path.join(enriched_dir, '*.csv'))):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                industry = (row.get(INDUSTRY_COLUMN) or '').strip()
+                if any(char.isalpha() for char in industry):
+                    counts[industry] += 1
+    return counts
+
+
+def load_industries(filepath: str = INDUSTRY_CATEGORIES_FILE) -> List[str]:
+    """Industries of the lookup table, or [] if it has not been built yet"""
+    if not os.path.exists(filepath):
+        return []
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return [row['Industry'] for row in csv.DictReader(f)]
+
+
+def save_table(counts: Counter, filepath: str = INDUSTRY_CATEGORIES_FILE):
+    """Write industries, lead counts and their category to CSV"""
+    categorizer = Categorizer(CATEGORY_RULES)
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Industry', 'Leads', 'Category'])
+        for industry, leads in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+            writer.writerow([industry, leads, categorizer.industry_category(industry)])
+
+
+def main():
+    counts = seed_industries()
+    # Keep industries from earlier runs whose leads have since been re-exported
+    for industry in load_industries():
+        counts.setdefault(industry, 0)
+    save_table(counts)
+
+    print(f"Industries: {len(counts)} ({sum(counts.values())} leads)")
+    print(f"Saved to: {INDUSTRY_CATEGORIES_FILE}")
+
+
+if __name__ == "__main__":
+    main()
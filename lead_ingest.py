@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Delta ingestion of new Phantombuster lead exports
+
+Each export largely repeats the previous one. A lead is identified by its
+Phantombuster leadId (from the `inline-flex href` URL) or, when that is
+missing, its LinkedIn profile URL (`invisible href`), and each row's content
+is hashed without the export-date columns, which move on every export.
+lead_index.sqlite remembers, per lead, that hash and the version of the
+Golden Sheet and rules it was processed with. ingest() sends only leads
+that are new, changed, or processed under an older version through enrich
+and score (into enriched_delta.csv / scored_delta.csv), upserts them into
+the lead store (lead_store.py), replacing earlier rows of the same leads,
+and exports the whole store as the final CSV. A store that is still empty
+is first filled from the existing final CSV. A weekly run then costs as
+much as its delta, not the full history.
+
+Usage:
+    python lead_ingest.py [EXPORT_CSV]
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import engine
+from consolidate_results import FINAL_OUTPUT
+from golden_sheet import CATEGORY_FILE, PIVOT_FILE, SNAPSHOT_FILE, load_golden_sheet
+from lead_store import DATE_COLUMNS, STORE_FILE, LeadStore, lead_id, lead_key, linkedin_url, row_hash
+from match_cache import CACHE_FILE, MatchCache
+from stage_cache import GOLDEN_SHEET_FILES, MATCHING_MODULES, SCORING_MODULES, version
+
+INDEX_FILE = "lead_index.sqlite"
+DELTA_NAME = 'delta'
+FINAL_RUN = 'final'  # store tag of the leads imported from an existing final CSV
+
+DATE = re.compile(r'(\d+)/(\d+)/(\d+)')
+
+
+def export_date(lead: Mapping[str, str]) -> str:
+    """Latest export date of a lead as YYYY-MM-DD, '' if it has none"""
+    dates = []
+    for column in DATE_COLUMNS:
+        match = DATE.fullmatch((lead.get(column) or '').strip())
+        if match:
+            month, day, year = (int(part) for part in match.groups())
+            dates.append(f"{year:04d}-{month:02d}-{day:02d}")
+    return max(dates, default='')
+
+
+def processing_version() -> str:
+    """Version of the Golden Sheet and rules that enrich and score depend on"""
+    return version(*GOLDEN_SHEET_FILES, *MATCHING_MODULES, *SCORING_MODULES) + f":{engine.DEFAULT_SCORING}"
+
+
+class LeadIndex:
+    """SQLite index of processed leads: key -> row hash and processing version
+
+    A lead's key is 'lead:<leadId>', or 'linkedin:<url>' without a leadId,
+    or 'row:<row hash>' without either. A lead that comes back under a new
+    leadId but the same LinkedIn URL keeps its first key.
+    """
+
+    def __init__(self, path: str = INDEX_FILE):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS leads (
+                key TEXT PRIMARY KEY,
+                lead_id TEXT NOT NULL,
+                linkedin TEXT NOT NULL,
+                row_hash TEXT NOT NULL,
+                version TEXT NOT NULL,
+                export_date TEXT NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS leads_lead_id ON leads (lead_id)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS leads_linkedin ON leads (linkedin)")
+        self.conn.commit()
+
+    def lookup(self, lead_id: str, linkedin: str) -> Optional[Tuple[str, str, str]]:
+        """(key, row_hash, version) of an indexed lead with this leadId or LinkedIn URL"""
+        for column, value in (('lead_id', lead_id), ('linkedin', linkedin)):
+            if value:
+                row = self.conn.execute(f"SELECT key, row_hash, version FROM leads WHERE {column} = ?",
+                                        (value,)).fetchone()
+                if row:
+                    return row
+        return None
+
+    def update(self, rows: Iterable[Tuple[str, str, str, str, str, str]]):
+        """Record processed leads as (key, lead_id, linkedin, row_hash, version, export_date)"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO leads (key, lead_id, linkedin, row_hash, version, export_date) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def close(self):
+        self.conn.close()
+
+
+def split_delta(leads: Iterable[Dict[str, str]], index: LeadIndex, current: str, counts: Dict[str, int],
+                pending: List[Tuple]) -> Iterable[Dict[str, str]]:
+    """Leads that are new, changed or processed under another version, in export order
+
+    counts gets 'new', 'changed', 'outdated' and 'unchanged' (repeats of a
+    lead within the export count as unchanged); pending gets the index row
+    of every lead yielded, to be recorded once its results are stored.
+    """
+    seen = set()
+    for lead in leads:
+        identity, url, digest = lead_id(lead), linkedin_url(lead), row_hash(lead)
+        known = index.lookup(identity, url)
+        key = known[0] if known else lead_key(lead)
+        if key in seen:
+            counts['unchanged'] += 1
+            continue
+        seen.add(key)
+
+        if known is None:
+            counts['new'] += 1
+        elif known[1] != digest:
+            counts['changed'] += 1
+        elif known[2] != current:
+            counts['outdated'] += 1
+        else:
+            counts['unchanged'] += 1
+            continue
+        pending.append((key, identity, url, digest, current, export_date(lead)))
+        yield lead
+
+
+def import_final(store: LeadStore, index: LeadIndex, final_file: str) -> int:
+    """Fill the store with final_file's leads; their number
+
+    Leads the index does not know are indexed as processed under no
+    version, so they are processed again when next exported, and their
+    leadId and LinkedIn URL resolve to the stored row.
+    """
+    keys, indexed = {}, []
+
+    def rows():
+        for position, lead in enumerate(engine.read_leads(final_file)):
+            identity, url = lead_id(lead), linkedin_url(lead)
+            known = index.lookup(identity, url)
+            if known:
+                yield known[0], position, lead
+                continue
+            key = keys.get(identity) or keys.get(url) or lead_key(lead)
+            keys.update((value, key) for value in (identity, url) if value)
+            indexed.append((key, identity, url, row_hash(lead), '', export_date(lead)))
+            yield key, position, lead
+
+    total = store.upsert(rows(), FINAL_RUN)
+    index.update(indexed)
+    return total
+
+
+def ingest(export_file: str = engine.LEADS_FILE, final_file: str = FINAL_OUTPUT, index_path: str = INDEX_FILE,
+           store_path: str = STORE_FILE):
+    """Enrich and score the new or changed leads of an export, store them and export the store to final_file"""
+    index = LeadIndex(index_path)
+    store = LeadStore(store_path)
+    if not store.count() and os.path.exists(final_file):
+        print(f"  Imported {import_final(store, index, final_file)} leads of {final_file} into {store_path}")
+    counts = {'new': 0, 'changed': 0, 'outdated': 0, 'unchanged': 0}
+    pending = []
+
+    sheet = load_golden_sheet(PIVOT_FILE, CATEGORY_FILE, snapshot=SNAPSHOT_FILE)
+    match_cache = MatchCache(PIVOT_FILE, engine.matcher_key(), path=CACHE_FILE)
+    delta = split_delta(engine.read_leads(export_file), index, processing_version(), counts, pending)
+    results = engine.run(DELTA_NAME, delta, sheet, match_cache)
+    match_cache.close()
+
+    print(f"  {counts['new']} new, {counts['changed']} changed, {counts['outdated']} processed under "
+          f"older rules, {counts['unchanged']} unchanged")
+    if results['leads']:
+        print(f"  {engine.summary(DELTA_NAME, results)}")
+        # Changed leads move after the others, in export order, as new ones
+        start = store.next_position()
+        scored = engine.read_leads(os.path.join(engine.SCORED_DIR, f"scored_{DELTA_NAME}.csv"))
+        store.upsert(((row[0], start + i, lead) for i, (row, lead) in enumerate(zip(pending, scored))), DELTA_NAME)
+        total = store.export_csv(final_file)
+        print(f"  Stored in {store_path} and exported to {final_file}: {total} leads")
+    store.close()
+    index.update(pending)
+    index.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Process only the new or changed leads of an export")
+    parser.add_argument('export', nargs='?', default=engine.LEADS_FILE)
+    parser.add_argument('--final', default=FINAL_OUTPUT, help="final enriched and scored CSV to export the store to")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("DELTA INGESTION")
+    print("=" * 80)
+    ingest(args.export, args.final)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Row-range batch manifests over the lead export
+
+A batch used to be a JSON copy of its leads. A manifest only names the
+export, its content hash and the byte ranges of the batch's rows, so
+creating batches writes a few hundred bytes whatever the export's size and
+no lead is serialized twice. Row boundaries come from one quote-aware scan
+of the export (a newline inside a quoted field does not end a row); readers
+mmap the export and parse only their ranges.
+
+Print a manifest's leads, or those of a batch file that still holds a JSON
+copy of them, as CSV (e.g. for an agent working on one batch):
+    python lead_manifest.py agent_batches/enrichment_batch_1.json > batch_1.csv
+"""
+
+import csv
+import json
+import mmap
+import os
+import sys
+from functools import lru_cache
+from itertools import islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from match_cache import file_hash
+
+Range = Tuple[int, int]
+COPY_BLOCK = 1 << 20  # bytes copied to stdout at a time
+BATCH_PLAN_FILE = os.path.join("agent_batches", "batch_plan.json")  # written by orchestrate_agents.py
+
+
+def _record_ends(f: BinaryIO) -> Iterator[int]:
+    """Byte offset of the end of every CSV record from f's position on
+
+    A physical line ends a record only once the quotes seen so far are
+    balanced; an escaped quote ("") counts twice, so it never unbalances a
+    field. A blank line outside quotes is no record, as csv.DictReader
+    skips it; its bytes go to the next record.
+    """
+    position = f.tell()
+    quotes = 0
+    for line in f:
+        position += len(line)
+        quotes += line.count(b'"')
+        if quotes % 2 == 0 and line.strip(b'\r\n'):
+            yield position
+    if quotes % 2:
+        yield position  # unterminated quote: the rest is one record
+
+
+def run_ranges(filepath: str, assignment: Iterable[Tuple[int, int]]) -> Tuple[Range, List[List[int]]]:
+    """Header byte range and [batch, rows, start, end] of every run of an assignment, in one scan
+
+    assignment is the (batch index, rows) runs of batch_planner, covering
+    every lead of filepath in order. Raises ValueError if the scan finds a
+    different number of leads.
+    """
+    runs = []
+    planned = scanned = 0
+    with open(filepath, 'rb') as f:
+        ends = _record_ends(f)
+        header = (0, next(ends, 0))
+        position = header[1]
+        for batch, rows in assignment:
+            start = position
+            for position in islice(ends, rows):
+                scanned += 1
+            runs.append([batch, rows, start, position])
+            planned += rows
+        scanned += sum(1 for _ in ends)
+    if scanned != planned:
+        raise ValueError(f"{filepath}: boundary scan found {scanned} rows, csv found {planned}")
+    return header, runs
+
+
+def skip_rows(filepath: str, start: int, rows: int) -> int:
+    """Byte offset rows records after the record starting at start"""
+    position = start
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        for position in islice(_record_ends(f), rows):
+            pass
+    return position
+
+
+def build_manifest(source: str, source_hash: str, header: Sequence[int], batch_num: int, rows: int,
+                   ranges: Iterable[Sequence[int]]) -> Dict:
+    """Manifest of rows leads of source in the given byte ranges, adjacent ranges merged"""
+    merged = []
+    for start, end in ranges:
+        if merged and merged[-1][1] == start:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return {
+        'batch_num': batch_num,
+        'source': source,
+        'source_hash': source_hash,
+        'header': list(header),
+        'rows': rows,
+        'ranges': merged,
+    }
+
+
+def save_manifest(manifest: Dict, filepath) -> None:
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+        f.write('\n')
+
+
+def planned_batches(plan_file: str = BATCH_PLAN_FILE) -> Optional[List[int]]:
+    """Batch numbers of the current plan, None if there is no plan
+
+    A replan with fewer batches leaves the files of the higher batch numbers
+    behind (agent results are never deleted), so readers take the batch list
+    from here rather than from the files present.
+    """
+    if not os.path.exists(plan_file):
+        return None
+    with open(plan_file, 'r', encoding='utf-8') as f:
+        return json.load(f)['batches']
+
+
+def load_manifest(filepath) -> Dict:
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def _source_matches(source: str, source_hash: str, size: int, mtime: float) -> bool:
+    # size and mtime are part of the key so an edited export is hashed again
+    return file_hash(source) == source_hash
+
+
+def check_source(manifest: Dict) -> None:
+    """Raise ValueError if the export changed since the manifest was made
+
+    The export is hashed once per process and version, not once per batch.
+    """
+    stat = os.stat(manifest['source'])
+    if not _source_matches(manifest['source'], manifest['source_hash'], stat.st_size, stat.st_mtime):
+        raise ValueError(f"{manifest['source']} changed since batch {manifest['batch_num']} was planned; "
+                         f"re-create the batches")
+
+
+def _lines(mm: mmap.mmap, start: int, end: int) -> Iterator[str]:
+    """Physical lines of mm[start:end], decoded one at a time
+
+    Ranges start and end on record boundaries, which are line ends, so no
+    line crosses end.
+    """
+    mm.seek(start)
+    while mm.tell() < end:
+        yield mm.readline().decode('utf-8')
+
+
+def parse_ranges(source: str, ranges: Sequence[Range], header: Range) -> Iterator[Dict[str, str]]:
+    """Leads in the byte ranges of source, parsed straight from a memory map one row at a time"""
+    with open(source, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        columns = next(csv.reader(_lines(mm, *header)))
+        for start, end in ranges:
+            yield from csv.DictReader(_lines(mm, start, end), fieldnames=columns)
+
+
+def manifest_leads(manifest: Dict) -> Iterator[Dict[str, str]]:
+    """Leads of a manifest's batch, in export order"""
+    check_source(manifest)
+    return parse_ranges(manifest['source'], manifest['ranges'], manifest['header'])
+
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit("usage: python lead_manifest.py MANIFEST.json")
+    manifest = load_manifest(sys.argv[1])
+    if 'leads' in manifest:
+        # Batch files that still hold a JSON copy of their leads, as engine.run_batch reads them
+        columns = list(dict.fromkeys(column for lead in manifest['leads'] for column in lead))
+        writer = csv.DictWriter(sys.stdout, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(manifest['leads'])
+        return
+    check_source(manifest)
+    with open(manifest['source'], 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        out = sys.stdout.buffer
+        out.write(mm[manifest['header'][0]:manifest['header'][1]])
+        for start, end in manifest['ranges']:
+            for block in range(start, end, COPY_BLOCK):
+                out.write(mm[block:min(block + COPY_BLOCK, end)])
+
+
+if __name__ == '__main__':
+    main()
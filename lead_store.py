@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+SQLite store of enriched and scored leads
+
+Stages used to hand results to each other as CSV files that every consumer
+parsed in full. leads.sqlite keeps one row per lead instead: the export's
+own columns as JSON, and the enrichment and score columns as real columns,
+with indexes on company, company_category, icp_score and
+brand_in_golden_sheet so statistics and filtered exports are answered by
+the index rather than a scan. The database runs in WAL mode, so the batches
+of a run write into it concurrently (each upsert is one executemany in one
+short transaction) while readers, which borrow connections from a small
+pool, see a consistent snapshot. The final CSV is always the projection of
+the whole store, whichever of orchestrate_agents.py --run or lead_ingest.py
+writes it, so neither truncates the other's history. Every upsert also
+replaces the store's revision token, which keys cached projections.
+
+A lead's key is 'lead:<leadId>', or 'linkedin:<url>' without a leadId, or
+'row:<row hash>' without either. Each row also records the run that wrote
+it (e.g. the --run score fingerprint), its batch and its position in the
+export, which orders the projection.
+
+Export the store, or only its leads scored at least 8.0, as CSV:
+    python lead_store.py [OUTPUT_CSV] [--min-score 8]
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import queue
+import re
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+import engine
+from checkpoint import atomic_open
+from consolidate_results import FINAL_OUTPUT
+from score_stats import ScoreStats
+
+STORE_FILE = "leads.sqlite"
+POOL_SIZE = 4  # pooled read-only connections
+BUSY_TIMEOUT = 30.0  # seconds a writer waits for another batch's transaction
+KEY_BATCH = 500  # keys per IN (...) query, below SQLite's variable limit
+
+LEAD_ID_COLUMN = 'inline-flex href'
+LINKEDIN_COLUMN = 'invisible href'
+DATE_COLUMNS = ('font-qanelas 19', 'font-qanelas 21')
+
+LEAD_ID = re.compile(r'[?&]leadId=(\d+)')
+LINKEDIN_PROFILE = re.compile(r'^(?:https?://)?(?:[a-z]+\.)?linkedin\.com/in/', re.IGNORECASE)
+
+# Columns added by the pipeline, which are not part of a lead's content
+DERIVED_COLUMNS = engine.ENRICHMENT_FIELDS + engine.SCORE_FIELDS
+
+Row = Tuple[str, int, Mapping[str, str]]
+
+
+def _values(lead: Mapping[str, str], column: str) -> Iterable[str]:
+    """lead[column] first, then every other value (rows of older outputs have shifted columns)"""
+    yield lead.get(column) or ''
+    for value in lead.values():
+        if isinstance(value, str):
+            yield value
+
+
+def lead_id(lead: Mapping[str, str]) -> str:
+    """Phantombuster leadId of a lead, '' if it has none"""
+    for value in _values(lead, LEAD_ID_COLUMN):
+        match = LEAD_ID.search(value)
+        if match:
+            return match.group(1)
+    return ''
+
+
+def linkedin_url(lead: Mapping[str, str]) -> str:
+    """LinkedIn profile URL in one form: no scheme, www, query or trailing slash, lowercase"""
+    for value in _values(lead, LINKEDIN_COLUMN):
+        url = value.strip()
+        if LINKEDIN_PROFILE.match(url):
+            url = LINKEDIN_PROFILE.sub('linkedin.com/in/', url).split('?')[0].split('#')[0]
+            return url.rstrip('/').lower()
+    return ''
+
+
+def row_hash(lead: Mapping[str, str]) -> str:
+    """SHA-256 of a lead's own columns, without export dates or pipeline columns"""
+    content = sorted((column, value or '') for column, value in lead.items()
+                     if isinstance(column, str) and column not in DERIVED_COLUMNS and column not in DATE_COLUMNS)
+    return hashlib.sha256(json.dumps(content).encode('utf-8')).hexdigest()
+
+
+def lead_key(lead: Mapping[str, str]) -> str:
+    """Store key of a lead: its leadId, else its LinkedIn URL, else its row hash"""
+    identity = lead_id(lead)
+    if identity:
+        return f"lead:{identity}"
+    url = linkedin_url(lead)
+    return f"linkedin:{url}" if url else f"row:{row_hash(lead)}"
+
+
+def _text(value) -> str:
+    return '' if value is None else str(value)
+
+
+class LeadStore:
+    """leads.sqlite: one writer connection per process, pooled readers"""
+
+    def __init__(self, path: str = STORE_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")  # durable at checkpoints, safe in WAL mode
+        enrichment = ''.join(f"{field} TEXT,\n" for field in engine.ENRICHMENT_FIELDS)
+        with self.conn:
+            self.conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS leads (
+                    key TEXT PRIMARY KEY,
+                    run TEXT NOT NULL,
+                    batch_num INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    company TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    {enrichment}
+                    icp_score REAL,
+                    score_reasoning TEXT
+                )
+            """)
+            # Export columns seen per run, so a projection's header needs no scan of data
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS lead_columns (
+                    run TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    PRIMARY KEY (run, name)
+                )
+            """)
+            # One row: a random token replaced by every upsert
+            self.conn.execute("CREATE TABLE IF NOT EXISTS revision (token TEXT NOT NULL)")
+            for column in ('run', 'company', 'company_category', 'icp_score', 'brand_in_golden_sheet'):
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS leads_{column} ON leads ({column})")
+        self._pool = queue.Queue()
+        self._readers = []
+
+    def upsert(self, rows: Iterable[Row], run: str, batch_num: int = 0) -> int:
+        """Insert or replace leads given as (key, position, lead) in one transaction; their number
+
+        lead holds the export columns and whichever enrichment and score
+        columns it has so far.
+        """
+        records, columns = [], set()
+        for key, position, lead in rows:
+            data = {column: value for column, value in lead.items()
+                    if isinstance(column, str) and column not in DERIVED_COLUMNS}
+            columns.update(data)
+            records.append((key, run, batch_num, position, engine.company_name(lead),
+                            json.dumps(data, ensure_ascii=False),
+                            *(lead.get(field) for field in DERIVED_COLUMNS)))
+        names = ['key', 'run', 'batch_num', 'position', 'company', 'data'] + DERIVED_COLUMNS
+        updates = ', '.join(f"{name} = excluded.{name}" for name in names[1:])
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO leads ({', '.join(names)}) VALUES ({', '.join('?' * len(names))}) "
+                f"ON CONFLICT (key) DO UPDATE SET {updates}", records)
+            self.conn.executemany("INSERT OR IGNORE INTO lead_columns (run, name) VALUES (?, ?)",
+                                  [(run, column) for column in columns])
+            self.conn.execute("DELETE FROM revision")
+            self.conn.execute("INSERT INTO revision (token) VALUES (?)", (os.urandom(16).hex(),))
+        return len(records)
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool, opening one if all are in use"""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, timeout=BUSY_TIMEOUT,
+                                   check_same_thread=False)
+            self._readers.append(conn)
+        try:
+            yield conn
+        finally:
+            if self._pool.qsize() < POOL_SIZE:
+                self._pool.put(conn)
+            else:
+                self._readers.remove(conn)
+                conn.close()
+
+    @staticmethod
+    def _where(run: Optional[str], min_score: Optional[float] = None) -> Tuple[str, list]:
+        clauses, params = [], []
+        if run is not None:
+            clauses.append("run = ?")
+            params.append(run)
+        if min_score is not None:
+            clauses.append("icp_score >= ? AND typeof(icp_score) IN ('real', 'integer')")
+            params.append(min_score)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def count(self, run: Optional[str] = None, batch_num: Optional[int] = None) -> int:
+        """Number of leads, of one run and batch if given"""
+        where, params = self._where(run)
+        if batch_num is not None:
+            where += (" AND" if where else " WHERE") + " batch_num = ?"
+            params.append(batch_num)
+        with self.reader() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM leads{where}", params).fetchone()[0]
+
+    def stored(self, keys: Iterable[str], run: Optional[str] = None) -> int:
+        """Number of the given (distinct) keys held by the store, under run if given"""
+        keys = list(keys)
+        where, params = self._where(run)
+        where += (" AND" if where else " WHERE") + " key IN ({})"
+        total = 0
+        with self.reader() as conn:
+            for start in range(0, len(keys), KEY_BATCH):
+                chunk = keys[start:start + KEY_BATCH]
+                total += conn.execute(f"SELECT COUNT(*) FROM leads{where.format(', '.join('?' * len(chunk)))}",
+                                      params + chunk).fetchone()[0]
+        return total
+
+    def revision(self) -> str:
+        """Token that changes with every upsert, '' for a store never written"""
+        with self.reader() as conn:
+            row = conn.execute("SELECT token FROM revision").fetchone()
+        return row[0] if row else ''
+
+    def next_position(self) -> int:
+        """Position after every stored lead's, to append leads to the projection"""
+        with self.reader() as conn:
+            return conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM leads").fetchone()[0]
+
+    def columns(self, run: Optional[str] = None) -> list:
+        """Sorted CSV columns of a projection: export columns seen, enrichment and score columns"""
+        where, params = self._where(run)
+        with self.reader() as conn:
+            names = {name for name, in conn.execute(f"SELECT DISTINCT name FROM lead_columns{where}", params)}
+        return sorted(names.union(DERIVED_COLUMNS))
+
+    def leads(self, run: Optional[str] = None, min_score: Optional[float] = None) -> Iterator[Dict[str, str]]:
+        """Stored leads as CSV-style dicts, in export order"""
+        where, params = self._where(run, min_score)
+        with self.reader() as conn:
+            cursor = conn.execute(f"SELECT data, {', '.join(DERIVED_COLUMNS)} FROM leads{where} "
+                                  f"ORDER BY position, key", params)
+            for data, *derived in cursor:
+                lead = json.loads(data)
+                lead.update(zip(DERIVED_COLUMNS, map(_text, derived)))
+                yield lead
+
+    def export_csv(self, filepath: str, run: Optional[str] = None, min_score: Optional[float] = None) -> int:
+        """Atomically write the leads (of a run, scored at least min_score) as CSV; their number"""
+        total = 0
+        with atomic_open(filepath, 'w', encoding='utf-8', newline='') as out:
+            writer = csv.DictWriter(out, fieldnames=self.columns(run), extrasaction='ignore')
+            writer.writeheader()
+            for lead in self.leads(run, min_score):
+                writer.writerow(lead)
+                total += 1
+        return total
+
+    def statistics(self, run: Optional[str] = None) -> Dict:
+        """consolidate_results statistics, from grouped queries on the indexed columns"""
+        where, params = self._where(run)
+        stats = {'scores': ScoreStats()}
+        with self.reader() as conn:
+            stats['total_leads'] = conn.execute(f"SELECT COUNT(*) FROM leads{where}", params).fetchone()[0]
+            for score, count in conn.execute(
+                    f"SELECT icp_score, COUNT(*) FROM leads{where} GROUP BY icp_score", params):
+                if isinstance(score, (int, float)):
+                    stats['scores'].counts[float(score)] += count
+            stats['in_golden_sheet'] = sum(count for value, count in conn.execute(
+                f"SELECT brand_in_golden_sheet, COUNT(*) FROM leads{where} GROUP BY brand_in_golden_sheet", params)
+                if _text(value).lower() == 'yes')
+            for column, name in (('company_category', 'categories'), ('company', 'companies')):
+                stats[name] = {'Unknown' if value is None else value: count for value, count in conn.execute(
+                    f"SELECT {column}, COUNT(*) FROM leads{where} GROUP BY {column}", params)}
+        return stats
+
+    def close(self):
+        for conn in self._readers:
+            conn.close()
+        self._readers = []
+        self._pool = queue.Queue()
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the lead store as CSV")
+    parser.add_argument('output', nargs='?', default=FINAL_OUTPUT)
+    parser.add_argument('--min-score', type=float, help="only leads with at least this icp_score")
+    parser.add_argument('--store', default=STORE_FILE)
+    args = parser.parse_args()
+
+    store = LeadStore(args.store)
+    total = store.export_csv(args.output, min_score=args.min_score)
+    store.close()
+    print(f"Wrote {total} leads to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Market codes as bitmasks
+
+Every market code ("US", "GB", "DE", ...) is interned into one MarketTable
+and gets a bit, so a brand's markets_list becomes a single integer and so
+does a lead's LinkedIn location (`font-qanelas 4`, or `font-qanelas 13` in
+shifted exports). "Does this brand test in the lead's market?" is then
+`brand_mask & lead_mask != 0` and "brands active in GB+DE" is
+`mask & required == required`, cheap enough to use as a filter or scoring
+feature over millions of rows (mask_array gives NumPy uint64 columns).
+
+Locations are resolved to an ISO country code from their last recognizable
+part: country names and their common translations, an ISO code as the last
+part ("Hamburg, DE", "Toronto, ON, CA"), US states, then known cities and
+metro areas as whole words ("Greater Boston", "London Area, United Kingdom").
+Regions like "Europe" or "Remote" resolve to no market (mask 0).
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+from aho_corasick import AhoCorasick
+
+LOCATION_COLUMNS = ('font-qanelas 4', 'font-qanelas 13')
+LOCATION_CACHE_SIZE = 1 << 16  # most recent locations resolved
+
+COUNTRY_NAMES = {
+    'US': ['united states', 'united states of america', 'usa', 'us', 'estados unidos',
+           'vereinigte staaten von amerika', 'états-unis', 'etats-unis'],
+    'GB': ['united kingdom', 'uk', 'uk&i', 'great britain', 'england', 'scotland', 'wales',
+           'northern ireland', 'royaume-uni', 'vereinigtes königreich', 'reino unido', 'великобритания'],
+    'DE': ['germany', 'deutschland', 'allemagne', 'alemania'],
+    'FR': ['france'],
+    'IE': ['ireland'],
+    'IT': ['italy', 'italia'],
+    'ES': ['spain', 'españa'],
+    'NL': ['netherlands', 'the netherlands', 'nederland'],
+    'AU': ['australia'],
+    'NZ': ['new zealand'],
+    'CA': ['canada'],
+    'MX': ['mexico', 'méxico'],
+    'BR': ['brazil', 'brasil'],
+    'JP': ['japan', '日本'],
+    'KR': ['korea', 'south korea', 'republic of korea', '대한민국'],
+    'CN': ['china', '中国'],
+    'HK': ['hong kong'],
+    'SG': ['singapore'],
+    'IN': ['india'],
+    'PH': ['philippines'],
+    'AE': ['united arab emirates', 'uae'],
+    'ZA': ['south africa'],
+}
+
+US_STATES = [
+    'alabama', 'alaska', 'arizona', 'arkansas', 'california', 'colorado', 'connecticut', 'delaware',
+    'district of columbia', 'florida', 'georgia', 'hawaii', 'idaho', 'illinois', 'indiana', 'iowa',
+    'kansas', 'kentucky', 'louisiana', 'maine', 'maryland', 'massachusetts', 'michigan', 'minnesota',
+    'mississippi', 'missouri', 'montana', 'nebraska', 'nevada', 'new hampshire', 'new jersey',
+    'new mexico', 'new york', 'north carolina', 'north dakota', 'ohio', 'oklahoma', 'oregon',
+    'pennsylvania', 'rhode island', 'south carolina', 'south dakota', 'tennessee', 'texas', 'utah',
+    'vermont', 'virginia', 'washington', 'west virginia', 'wisconsin', 'wyoming',
+    'al', 'ak', 'az', 'ar', 'ca', 'co', 'ct', 'de', 'dc', 'fl', 'ga', 'hi', 'id', 'il', 'in', 'ia',
+    'ks', 'ky', 'la', 'me', 'md', 'ma', 'mi', 'mn', 'ms', 'mo', 'mt', 'ne', 'nv', 'nh', 'nj', 'nm',
+    'ny', 'nc', 'nd', 'oh', 'ok', 'or', 'pa', 'ri', 'sc', 'sd', 'tn', 'tx', 'ut', 'vt', 'va', 'wa',
+    'wv', 'wi', 'wy',
+]
+
+# Cities and metro areas that LinkedIn shows without a country
+CITY_NAMES = {
+    'US': ['new york', 'boston', 'seattle', 'los angeles', 'atlanta', 'san francisco', 'phoenix',
+           'detroit', 'kansas city', 'washington dc', 'baltimore', 'lexington', 'san diego', 'miami',
+           'chicago', 'philadelphia', 'buffalo', 'needham', 'dallas', 'houston', 'portland',
+           'denver', 'austin', 'minneapolis', 'beaverton', 'sunnyvale', 'cupertino', 'dearborn'],
+    'GB': ['london', 'leeds', 'manchester', 'birmingham', 'cheshire', 'essex', 'bristol', 'edinburgh',
+           'glasgow'],
+    'CN': ['上海', '深圳', '北京', 'shanghai', 'shenzhen', 'beijing'],
+}
+
+AREA_SUFFIXES = (' metropolitan area', ' area')
+
+_COUNTRIES: Dict[str, str] = {name: code for code, names in COUNTRY_NAMES.items() for name in names}
+_ISO_CODES: Dict[str, str] = {code.lower(): code for code in COUNTRY_NAMES}
+_STATES = frozenset(US_STATES)
+_CITY_MATCHER = AhoCorasick((city, code) for code, cities in CITY_NAMES.items() for city in cities)
+
+
+def _strip_area(part: str) -> str:
+    for suffix in AREA_SUFFIXES:
+        if part.endswith(suffix):
+            return part[:-len(suffix)]
+    return part
+
+
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
+def country_code(location: str) -> Optional[str]:
+    """ISO country code of a LinkedIn location, or None if it names no country"""
+    if not location:
+        return None
+    parts = [_strip_area(part.strip().lower()) for part in location.split(',')]
+    for part in reversed(parts):
+        if part in _COUNTRIES:
+            return _COUNTRIES[part]
+    # An ISO code ends the location, so "Chennai, IN" is India, not Indiana
+    if len(parts) > 1 and parts[-1] in _ISO_CODES:
+        return _ISO_CODES[parts[-1]]
+    # With no country present, a state only counts after a city ("Portland,
+    # Oregon"), so a lone "Georgia" or "CA" is not mistaken for a US location
+    if len(parts) > 1 and any(part in _STATES for part in parts[1:]):
+        return 'US'
+    for _, code in _CITY_MATCHER.words(location.lower()):
+        return code
+    return None
+
+
+class MarketTable:
+    """Interned market codes; code i is bit 1 << i"""
+
+    def __init__(self, codes: Iterable[str] = ()):
+        self.codes: List[str] = []
+        self._bits: Dict[str, int] = {}
+        for code in codes:
+            self.intern(code)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def intern(self, code: str) -> int:
+        """Bit index of code, assigning the next free bit to new codes"""
+        code = code.strip().upper()
+        bit = self._bits.get(code)
+        if bit is None:
+            bit = self._bits[code] = len(self.codes)
+            self.codes.append(code)
+        return bit
+
+    def mask(self, codes: Iterable[str]) -> int:
+        """Bitmask of market codes"""
+        mask = 0
+        for code in codes:
+            if code.strip():
+                mask |= 1 << self.intern(code)
+        return mask
+
+    def codes_of(self, mask: int) -> List[str]:
+        """Market codes set in mask, in table order"""
+        return [code for bit, code in enumerate(self.codes) if mask >> bit & 1]
+
+    def location_mask(self, location: str) -> int:
+        """Bitmask of a LinkedIn location (0 if no country is recognized)"""
+        code = country_code(location or '')
+        return 1 << self.intern(code) if code else 0
+
+    def lead_mask(self, lead: Mapping[str, str]) -> int:
+        """Bitmask of a lead's location, trying each LOCATION_COLUMNS in turn"""
+        for column in LOCATION_COLUMNS:
+            mask = self.location_mask(lead.get(column) or '')
+            if mask:
+                return mask
+        return 0
+
+
+def overlaps(a: int, b: int) -> bool:
+    """Whether two market masks share a market"""
+    return a & b != 0
+
+
+def covers(mask: int, required: int) -> bool:
+    """Whether mask includes every market in required"""
+    return mask & required == required
+
+
+def mask_array(masks: Iterable[int]) -> np.ndarray:
+    """Masks as a uint64 column for vectorized filters (tables up to 64 codes)"""
+    return np.fromiter(masks, dtype=np.uint64)
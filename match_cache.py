@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Persistent cache of company -> Golden Sheet brand matches
+
+The same companies (Amazon, Coca-Cola, Disney, ...) show up in every export, so
+resolved matches are stored in SQLite and reused across runs. Entries are keyed
+by the normalized company name and a content hash of the pivot table CSV: any
+edit to the Golden Sheet produces a new hash, so old entries are never hit;
+they stay until golden_sheet_diff carries the unaffected ones over to the new
+hash and drops the rest.
+"""
+
+import hashlib
+import os
+import sqlite3
+from typing import Callable, Optional, Set, Tuple
+
+CACHE_FILE = "match_cache.sqlite"
+
+
+def file_hash(filepath: str) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hit_summary(hits: int, misses: int) -> str:
+    """One-line hit/miss report, e.g. of counters summed over worker processes"""
+    lookups = hits + misses
+    rate = hits / lookups * 100 if lookups else 0.0
+    return f"Match cache: {hits} hits, {misses} misses ({rate:.1f}% hit rate)"
+
+
+class MatchCache:
+    """SQLite-backed company -> brand cache for one matcher and pivot version
+
+    `matcher` separates matchers whose rules differ, so one matcher's
+    answer is never served to another; a matcher given as 'name@version'
+    drops the entries of its other versions. A cached brand of None records
+    a confirmed "no match".
+    """
+
+    def __init__(self, pivot_file: str, matcher: str, path: str = CACHE_FILE):
+        self.pivot_hash = file_hash(pivot_file)
+        self.matcher = matcher
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS matches (
+                pivot_hash TEXT NOT NULL,
+                matcher TEXT NOT NULL,
+                company TEXT NOT NULL,
+                brand TEXT,
+                score REAL NOT NULL,
+                PRIMARY KEY (pivot_hash, matcher, company)
+            )
+        """)
+        # Entries of other pivot hashes are left for golden_sheet_diff to carry over;
+        # entries made by an older version of this matcher can never be hit again
+        name, versioned, _ = matcher.partition('@')
+        if versioned:
+            self.conn.execute("DELETE FROM matches WHERE matcher != ? AND substr(matcher, 1, ?) = ?",
+                              (matcher, len(name) + 1, f"{name}@"))
+        self.conn.commit()
+
+    def get(self, company: str) -> Optional[Tuple[Optional[str], float]]:
+        """(brand, score) for a cached company, or None on a cache miss"""
+        row = self.conn.execute(
+            "SELECT brand, score FROM matches WHERE pivot_hash = ? AND matcher = ? AND company = ?",
+            (self.pivot_hash, self.matcher, company),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0], row[1]
+
+    def known(self) -> Set[str]:
+        """Every company cached for this matcher and pivot version (no hit/miss counting)"""
+        rows = self.conn.execute(
+            "SELECT company FROM matches WHERE pivot_hash = ? AND matcher = ?", (self.pivot_hash, self.matcher)
+        )
+        return {row[0] for row in rows}
+
+    def put(self, company: str, brand: Optional[str], score: float = 1.0):
+        """Record the resolved brand (None for no match) for company"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO matches (pivot_hash, matcher, company, brand, score) VALUES (?, ?, ?, ?, ?)",
+            (self.pivot_hash, self.matcher, company, brand, score),
+        )
+
+    def commit(self):
+        """Publish puts so far to other processes sharing the cache file
+
+        Commit after each burst of puts so concurrent workers never wait long
+        on SQLite's write lock.
+        """
+        self.conn.commit()
+
+    def summary(self) -> str:
+        """One-line hit/miss report for the enrichment summary"""
+        return hit_summary(self.hits, self.misses)
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+def carry_over(path: str, old_hash: str, new_hash: str,
+               keep: Callable[[str, Optional[str]], bool]) -> Tuple[int, int]:
+    """Re-key old_hash entries to new_hash where keep(company, brand) holds
+
+    Used after a Golden Sheet refresh so companies the change cannot affect
+    stay cache hits; the rest are dropped and get re-matched. Returns
+    (kept, dropped).
+    """
+    if not os.path.exists(path):
+        return 0, 0
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT matcher, company, brand, score FROM matches WHERE pivot_hash = ?", (old_hash,)
+        ).fetchall()
+        kept = [(new_hash, matcher, company, brand, score)
+                for matcher, company, brand, score in rows if keep(company, brand)]
+        conn.executemany(
+            "INSERT OR REPLACE INTO matches (pivot_hash, matcher, company, brand, score) VALUES (?, ?, ?, ?, ?)",
+            kept,
+        )
+        conn.execute("DELETE FROM matches WHERE pivot_hash = ?", (old_hash,))
+        conn.commit()
+    finally:
+        conn.close()
+    return len(kept), len(rows) - len(kept)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Shared normalization of company and brand names for matching
+
+Every matcher normalizes both sides with normalize_name so "Estée Lauder",
+"ESTEE LAUDER" and "The Estée Lauder Companies Inc." all compare equal:
+casefold, NFKD accent folding, '&' -> 'and', punctuation squashing (hyphens
+are kept, so "t-mobile" and "coca-cola" stay intact) and legal-suffix
+stripping. Patterns are compiled once and the most recent NAME_CACHE_SIZE
+results are memoized, because the same few hundred brand and company names
+are normalized over and over.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+NAME_CACHE_SIZE = 1 << 16
+
+PUNCTUATION = re.compile(r'[^\w\s-]')
+WHITESPACE = re.compile(r'\s+')
+LEADING_ARTICLE = re.compile(r'^the\s+')
+LEGAL_SUFFIX = re.compile(
+    r'\s+(?:inc|incorporated|corp|corporation|company|companies|co|ltd|limited|llc|plc|gmbh|the)$'
+)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def fold_case(name: str) -> str:
+    """Casefolded name with accents removed ("Estée" -> "estee")
+
+    Only marks on ASCII letters are dropped; kana and hangul are recomposed
+    unchanged, so "アップル" does not turn into "アッフル".
+    """
+    folded = []
+    for char in unicodedata.normalize('NFKD', name.casefold()):
+        if unicodedata.combining(char) and folded and folded[-1].isascii():
+            continue
+        folded.append(char)
+    return unicodedata.normalize('NFC', ''.join(folded))
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def normalize_name(name: str) -> str:
+    """Canonical matching form of a company or brand name"""
+    if not name:
+        return ""
+    name = fold_case(name).replace('&', ' and ')
+    name = PUNCTUATION.sub('', name)
+    name = WHITESPACE.sub(' ', name).strip()
+
+    # Strip legal suffixes ("ford motor company" -> "ford motor"), but never
+    # down to nothing: "The Company" stays "the company"
+    stripped = LEADING_ARTICLE.sub('', name)
+    while True:
+        shorter = LEGAL_SUFFIX.sub('', stripped)
+        if shorter == stripped:
+            break
+        stripped = shorter
+    return stripped or name
@@ -7,104 +7,484 @@ This script:
 2. Launches parallel enrichment agents (add golden sheet data)
 3. Launches parallel scoring agents (web research + ICP scoring)
 4. Consolidates results into final CSV
+
+Batches are contiguous row ranges balanced by estimated matching cost
+(batch_planner.py), one per core unless --agents says otherwise. With
+--shard, batches are company shards instead: every lead of a company lands
+in the same batch, so each company is matched and researched only once.
+Batch files are manifests of byte ranges into the export (lead_manifest.py),
+not copies of the leads.
+
+With --run, steps 2-4 run here instead of through agents: the batches are
+cut into small chunks that engine.py enriches and scores on a process pool
+with one worker per core (each worker loads the Golden Sheet and rules once,
+in its initializer). Chunks are sent as manifests too and each worker parses
+its rows from a memory map of the export. Idle workers pull the next chunk.
+With --shard, each company shard is a single chunk instead, so all leads of
+a company are enriched and scored by one worker.
+Each chunk's output is written atomically and journaled (checkpoint.py), so
+a rerun after a crash skips finished chunks; a batch's files are joined from
+its chunks once all are done. After a Golden Sheet refresh, chunks whose
+leads golden_sheet_diff.py found unaffected are carried over from the
+journal instead of being enriched again. Workers also upsert their chunk's leads into
+the WAL-mode lead store (lead_store.py) as they finish, concurrently, and
+the final CSV is exported from the whole store, like lead_ingest.py does,
+with statistics from its indexes.
+Batching, enrichment, scoring and consolidation are each skipped when their
+inputs are unchanged since an earlier run (stage_cache.py):
+    python orchestrate_agents.py --run [--agents N] [--shard]
 """
 
+import argparse
 import csv
 import json
 import math
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
 
+import engine
+from batch_planner import (STEAL_CHUNK, batch_cost, company_costs, merge_runs, plan_batches, plan_shards,
+                           range_assignment, run_length)
+from checkpoint import Journal, atomic_open, concat_csv, content_key
+from consolidate_results import FINAL_OUTPUT as CONSOLIDATED_FILE, print_statistics
+from golden_sheet import SNAPSHOT_FILE, load_golden_sheet
+from golden_sheet_diff import earlier_sheets
+from lead_manifest import BATCH_PLAN_FILE, build_manifest, manifest_leads, run_ranges, save_manifest, skip_rows
+from lead_store import STORE_FILE, LeadStore, lead_key
+from match_cache import CACHE_FILE, MatchCache, file_hash, hit_summary
+from name_normalization import normalize_name
+from stage_cache import (BATCHING_MODULES, GOLDEN_SHEET_FILES, MATCHING_MODULES, SCORING_MODULES, StageCache,
+                         version)
+
 # Configuration
 LEADS_FILE = "Exports_Leads_BrandManager.csv"
 CATEGORY_FILE = "Golden Sheet - Category_Count.csv"
 PIVOT_FILE = "Golden Sheet - Pivot Table Brands.csv"
 OUTPUT_DIR = Path("agent_batches")
+PLAN_FILE = Path(BATCH_PLAN_FILE)
 ENRICHED_DIR = Path("enriched_results")
 SCORED_DIR = Path("scored_results")
+CHUNK_ENRICHED_DIR = ENRICHED_DIR / "chunks"
+CHUNK_SCORED_DIR = SCORED_DIR / "chunks"
 FINAL_OUTPUT = "Leads_Enriched_and_Scored.csv"
-NUM_AGENTS = 8
+RUN_RESULTS_FILE = "run_results.json"  # batch result files --run has written
+NUM_AGENTS = os.cpu_count() or 1
+
+def iter_csv(filename):
+    """Yield CSV rows one at a time"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        yield from csv.DictReader(f)
 
 def load_csv(filename):
     """Load CSV file and return rows"""
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+    return list(iter_csv(filename))
 
-def create_batches(leads, num_batches):
-    """Split leads into equal batches"""
-    batch_size = math.ceil(len(leads) / num_batches)
-    batches = []
+def count_rows(filename):
+    """Number of CSV rows, without keeping them"""
+    return sum(1 for _ in iter_csv(filename))
 
-    for i in range(num_batches):
-        start_idx = i * batch_size
-        end_idx = min(start_idx + batch_size, len(leads))
-        batch = leads[start_idx:end_idx]
-        if batch:  # Only add non-empty batches
-            batches.append({
-                'batch_num': i + 1,
-                'leads': batch,
-                'start_idx': start_idx,
-                'end_idx': end_idx
-            })
-
-    return batches
-
-def save_batch_files(batches, output_dir, prefix="batch"):
-    """Save batches as individual JSON files"""
+def csv_header(filename):
+    """Column names of a CSV file"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        return next(csv.reader(f), [])
+
+def create_batches(companies, num_batches, shards):
+    """Split company runs into batches by the batch index runs of the leads
+
+    shards comes from batch_planner.plan_shards or range_assignment; each
+    batch's 'companies' are the (company, rows) runs of its leads and 'rows'
+    its number of leads.
+    """
+    batches = [[] for _ in range(num_batches)]
+    for company, shard, rows in merge_runs(companies, shards):
+        batches[shard].append((company, rows))
+    for i, batch_companies in enumerate(batches):
+        yield {'batch_num': i + 1, 'companies': batch_companies, 'rows': sum(rows for _, rows in batch_companies)}
+
+def save_manifests(runs, num_batches, header, source_hash, output_dir, prefix="batch"):
+    """Save one byte-range manifest per batch of the plan's [batch index, rows, start, end] runs"""
     output_dir.mkdir(exist_ok=True)
-    batch_files = []
-
+    ranges = [[] for _ in range(num_batches)]
+    rows = [0] * num_batches
+    for batch, count, start, end in runs:
+        ranges[batch].append((start, end))
+        rows[batch] += count
+    filenames = []
+    for i in range(num_batches):
+        filename = output_dir / f"{prefix}_{i + 1}.json"
+        save_manifest(build_manifest(LEADS_FILE, source_hash, header, i + 1, rows[i], ranges[i]), filename)
+        filenames.append(filename)
+    return filenames
+
+# Reference data of a --run worker process, loaded once by init_worker
+_worker = {}
+
+def init_worker(run):
+    """Load the Golden Sheet, rules and match cache and open the lead store once per worker process
+
+    run tags the leads the worker stores.
+    """
+    _worker['run'] = run
+    _worker['store'] = LeadStore()
+    _worker['sheet'] = load_golden_sheet(PIVOT_FILE, CATEGORY_FILE, snapshot=SNAPSHOT_FILE)
+    _worker['match_cache'] = MatchCache(PIVOT_FILE, engine.matcher_key(), path=CACHE_FILE)
+    engine.categorizer()
+    engine.scorer()
+
+def process_chunk(task):
+    """Enrich and score one chunk (a work-stealing chunk or a whole shard) into its own files in a worker
+
+    task is (key, manifest, rows), rows the (start, end) ranges of the
+    chunk's export rows; the chunk's files are named after its journal key
+    and only appear once complete (engine.ResultWriter). Leads stream
+    through in engine.CHUNK_SIZE pieces, each written and then upserted into
+    the lead store in one transaction, at their export rows, so a whole
+    company shard is never held in memory. The counts also carry the
+    worker's match cache hits and misses while enriching it.
+    """
+    key, manifest, ranges = task
+    rows = (row for start, end in ranges for row in range(start, end))
+    sheet, match_cache, store = _worker['sheet'], _worker['match_cache'], _worker['store']
+    hits, misses = match_cache.hits, match_cache.misses
+    leads = engine.score(engine.enrich(manifest_leads(manifest), sheet, match_cache=match_cache))
+    name = f"batch_{manifest['batch_num']}_{key[:16]}"
+    with engine.ResultWriter(name, csv_header(manifest['source']), CHUNK_ENRICHED_DIR, CHUNK_SCORED_DIR) as writer:
+        for piece in engine.chunked(zip(rows, leads)):
+            for _, lead in piece:
+                writer.write(lead)
+            store.upsert(((lead_key(lead), row, lead) for row, lead in piece), _worker['run'], manifest['batch_num'])
+    counts = writer.counts.copy()
+    counts['cache_hits'] = match_cache.hits - hits
+    counts['cache_misses'] = match_cache.misses - misses
+    return key, manifest['batch_num'], writer.paths, counts
+
+def ordered_map(pool, fn, tasks, window):
+    """Results of fn over tasks in task order, with at most window tasks queued
+
+    Workers take queued tasks as they become idle, so a slow chunk never
+    holds up the others; the window keeps only a few chunks in memory.
+    """
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.submit(fn, task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def batch_chunks(runs, chunk_size=STEAL_CHUNK):
+    """(batch_num, pieces) chunks of at most chunk_size leads of one batch
+
+    runs are the plan's [batch index, rows, start, end] runs in row order;
+    pieces are (first row, rows, start, end) parts of them. A run is cut
+    where its batch's chunk fills up (lead_manifest.skip_rows), and a
+    batch's chunk is emitted when full or when the batch has no leads left,
+    so only one partial chunk per batch is ever held.
+    """
+    remaining = Counter()
+    for batch, rows, _, _ in runs:
+        remaining[batch] += rows
+    pending = {}
+    filled = Counter()
+    row = 0
+    for batch, rows, start, end in runs:
+        while rows:
+            step = min(rows, chunk_size - filled[batch])
+            cut = end if step == rows else skip_rows(LEADS_FILE, start, step)
+            pending.setdefault(batch, []).append((row, step, start, cut))
+            filled[batch] += step
+            remaining[batch] -= step
+            row, rows, start = row + step, rows - step, cut
+            if filled[batch] >= chunk_size or not remaining[batch]:
+                filled[batch] = 0
+                yield batch + 1, pending.pop(batch)
+
+def plan_chunks(runs, header, source_hash, versions, chunk_size=STEAL_CHUNK):
+    """(key, manifest, rows) of every work-stealing chunk, in row order
+
+    rows are the chunk's (start, end) export row ranges. A chunk's journal
+    key covers the export it reads, its rows and versions (of the Golden
+    Sheet and of the rules it is enriched and scored with).
+    """
+    for batch_num, pieces in batch_chunks(runs, chunk_size):
+        manifest = build_manifest(LEADS_FILE, source_hash, header, batch_num, sum(rows for _, rows, _, _ in pieces),
+                                  ((start, end) for _, _, start, end in pieces))
+        rows = [(first, first + count) for first, count, _, _ in pieces]
+        yield content_key(source_hash, manifest['ranges'], *versions), manifest, rows
+
+def finish_batch(batch_num, keys, journal):
+    """Join a batch's journaled chunks into its enriched and scored files; its counts"""
+    entries = [journal.entries[key] for key in keys]
+    concat_csv([entry['enriched'] for entry in entries], str(ENRICHED_DIR / f"enriched_batch_{batch_num}.csv"))
+    concat_csv([entry['scored'] for entry in entries], str(SCORED_DIR / f"scored_batch_{batch_num}.csv"))
+    return sum((Counter(entry['counts']) for entry in entries), Counter())
+
+def carry_refreshed(chunks, source_hash, versions, journal):
+    """Journal the chunks Golden Sheet refreshes cannot change under their new keys; how many
+
+    versions are plan_chunks' and start with the sheet version. A chunk
+    finished against a sheet golden_sheet_diff.py refreshed since keeps its
+    files if none of its leads has a company the refreshes affect (or one the
+    match cache no longer holds) or a category whose asset count changed.
+    """
+    earlier = earlier_sheets(versions[0])
+    if not earlier:
+        return 0
+    match_cache = MatchCache(PIVOT_FILE, engine.matcher_key(), path=CACHE_FILE)
+    known = match_cache.known()
+    match_cache.close()
+    carried = 0
+    for key, manifest, _ in chunks:
+        if journal.finished(key):
+            continue
+        for sheet_version, companies, categories in earlier:
+            entry = journal.finished(content_key(source_hash, manifest['ranges'], sheet_version, *versions[1:]))
+            if entry is not None:
+                break
+        else:
+            continue
+        unaffected = known - companies
+        if any(normalize_name(engine.company_name(lead)) not in unaffected
+               or lead['company_category'] in categories for lead in engine.read_leads(entry['enriched'])):
+            continue
+        journal.record(key, entry['files'], **{name: value for name, value in entry.items()
+                                               if name not in ('key', 'files')})
+        carried += 1
+    return carried
+
+def run_chunks(chunks, run, workers=None, journal=None):
+    """Enrich and score chunks on a process pool, resuming from the journal
+
+    chunks are plan_chunks' (key, manifest, rows) triples; run tags their
+    leads in the lead store. Chunks the journal has finished, with intact
+    files, are not run again. Yields (name, counts) per batch, as
+    engine.run_batch, as each batch's last chunk is done.
+    """
+    journal = journal or Journal()
+    keys = {}
+    for key, manifest, _ in chunks:
+        keys.setdefault(manifest['batch_num'], []).append(key)
+    tasks = [chunk for chunk in chunks if not journal.finished(chunk[0])]
+    pending = Counter(manifest['batch_num'] for _, manifest, _ in tasks)
+
+    for batch_num in keys:
+        if not pending[batch_num]:
+            yield f"batch_{batch_num}", finish_batch(batch_num, keys[batch_num], journal)
+    if not tasks:
+        return
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(run,)) as pool:
+        for key, batch_num, (enriched, scored), counts in ordered_map(pool, process_chunk, tasks, workers * 2):
+            journal.record(key, [enriched, scored], batch_num=batch_num, rows=counts['leads'],
+                           enriched=enriched, scored=scored, counts=dict(counts))
+            pending[batch_num] -= 1
+            if not pending[batch_num]:
+                yield f"batch_{batch_num}", finish_batch(batch_num, keys[batch_num], journal)
+
+def result_files(batch_nums):
+    """enriched and scored result files of the given batches"""
+    return ([str(ENRICHED_DIR / f"enriched_batch_{n}.csv") for n in batch_nums],
+            [str(SCORED_DIR / f"scored_batch_{n}.csv") for n in batch_nums])
+
+def remove_stale_results(batch_nums):
+    """Delete batch result files an earlier --run wrote that this plan no longer has
+
+    The files of this plan are recorded in RUN_RESULTS_FILE before they are
+    written, so a later --run knows they are its own. Files --run never
+    wrote (agent results, committed batches) are left alone.
+    """
+    keep = set().union(*result_files(batch_nums))
+    try:
+        with open(RUN_RESULTS_FILE, 'r', encoding='utf-8') as f:
+            written = json.load(f)
+    except FileNotFoundError:
+        written = []
+    for path in written:
+        if path not in keep and os.path.exists(path):
+            os.remove(path)
+    with atomic_open(RUN_RESULTS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(sorted(keep), f)
+
+def plan(args, source_hash):
+    """Steps 1-3: scan the export, plan batches and save their manifests and PLAN_FILE"""
+    # Scan data (only normalized company names are kept, not the rows)
+    print("\n[1/6] Scanning data files...")
+    companies = run_length(normalize_name(engine.company_name(lead)) for lead in iter_csv(LEADS_FILE))
+    num_leads = sum(rows for _, rows in companies)
+
+    print(f"  ✓ Found {num_leads} leads")
+    print(f"  ✓ Found {count_rows(CATEGORY_FILE)} categories")
+    print(f"  ✓ Found {count_rows(PIVOT_FILE)} brands in pivot table")
+
+    # Plan batches of even estimated cost
+    kind = "company shards" if args.shard else "batches"
+    print(f"\n[2/6] Planning {args.agents} {kind} by estimated matching cost...")
+    sheet = load_golden_sheet(PIVOT_FILE, CATEGORY_FILE, snapshot=SNAPSHOT_FILE)
+    match_cache = MatchCache(PIVOT_FILE, engine.matcher_key(), path=CACHE_FILE)
+    costs = company_costs((company for company, _ in companies), sheet, match_cache)
+    match_cache.close()
+    if args.shard:
+        assignment = plan_shards(companies, costs, args.agents)
+    else:
+        assignment = range_assignment(plan_batches(companies, costs, args.agents))
+    batches = [batch for batch in create_batches(companies, args.agents, shards=assignment) if batch['rows']]
+    print(f"  ✓ Created {len(batches)} batches")
     for batch in batches:
-        filename = output_dir / f"{prefix}_{batch['batch_num']}.json"
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(batch, f, indent=2)
-        batch_files.append(filename)
-
-    return batch_files
+        cost = batch_cost(batch['companies'], costs)
+        print(f"    - Batch {batch['batch_num']}: {batch['rows']} leads, "
+              f"{len({company for company, _ in batch['companies']})} companies (est. cost {cost:.0f})")
+
+    # Save batch manifests (byte ranges into the export, not copies of the leads)
+    print(f"\n[3/6] Saving batch manifests...")
+    header, runs = run_ranges(LEADS_FILE, assignment)
+    batch_files = save_manifests(runs, args.agents, header, source_hash, OUTPUT_DIR, prefix="enrichment_batch")
+    # The assignment as runs of consecutive rows with their byte ranges, not per lead
+    with open(PLAN_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'batches': [batch['batch_num'] for batch in batches], 'header': header, 'runs': runs}, f)
+    print(f"  ✓ Saved {len(batch_files)} batch manifests to {OUTPUT_DIR}/")
+    return [str(PLAN_FILE)] + [str(path) for path in batch_files]
+
+def enrich_and_score(runs, header, source_hash, versions, run, shard=False):
+    """Step 4 of --run: every chunk on the process pool, resuming from the journal
+
+    Company shards are not cut into work-stealing chunks: each is one task,
+    so its companies are handled by a single worker.
+    """
+    chunk_size = math.inf if shard else STEAL_CHUNK
+    chunks = list(plan_chunks(runs, header, source_hash, versions, chunk_size))
+    journal = Journal()
+    carried = carry_refreshed(chunks, source_hash, versions, journal)
+    done = sum(1 for key, _, _ in chunks if journal.finished(key))
+    workers = min(os.cpu_count() or 1, max(1, len(chunks) - done))
+    print(f"\n[4/6] Enriching and scoring {len(chunks) - done} chunks on {workers} worker processes"
+          f" ({done} already done)...")
+    if carried:
+        print(f"  ✓ Carried {carried} chunks the Golden Sheet refresh does not affect over from the journal")
+    total = Counter()
+    for name, counts in run_chunks(chunks, run, workers, journal):
+        print(f"  ✓ {engine.summary(name, counts)}")
+        total.update(counts)
+    journal.prune(key for key, _, _ in chunks)
+    # A company is resolved once per chunk it appears in
+    print(f"  ✓ {engine.reduction(total)}")
+    print(f"  ✓ {hit_summary(total['cache_hits'], total['cache_misses'])}")
+    print(f"  ✓ Results in {ENRICHED_DIR}/ and {SCORED_DIR}/")
+
+def rescore(batch_nums):
+    """Step 4 of --run when only the scoring rules changed: score the enriched batches again"""
+    print(f"\n[4/6] Enrichment unchanged, scoring {len(batch_nums)} batches again...")
+    for n in batch_nums:
+        print(f"  ✓ {engine.summary(f'batch_{n}', engine.rescore(f'batch_{n}'))}")
+    print(f"  ✓ Results in {ENRICHED_DIR}/ and {SCORED_DIR}/")
+
+def load_batches(store, run, runs):
+    """Upsert the leads of scored_batch_N.csv files that are not all stored under run
+
+    Workers store what they score, but batches restored from the stage
+    cache, resumed from the journal or rescored were never stored under run.
+    Each batch is streamed engine.CHUNK_SIZE leads at a time and a chunk is
+    only upserted if some of its distinct keys are missing (a lead repeated
+    in the export is stored once).
+    """
+    rows = {}
+    first = 0
+    for batch, count, _, _ in runs:
+        rows.setdefault(batch + 1, []).append(range(first, first + count))
+        first += count
+    for batch_num, ranges in sorted(rows.items()):
+        scored = engine.read_leads(str(SCORED_DIR / f"scored_batch_{batch_num}.csv"))
+        leads = zip(chain.from_iterable(ranges), scored)
+        stored = 0
+        for chunk in engine.chunked((lead_key(lead), row, lead) for row, lead in leads):
+            keys = {key for key, _, _ in chunk}
+            if store.stored(keys, run) != len(keys):
+                stored += store.upsert(chunk, run, batch_num)
+        if stored:
+            print(f"  ✓ Stored {stored} leads of batch_{batch_num} in {STORE_FILE}")
+
+def consolidate(store):
+    """Step 5 of --run: the final CSV and statistics, from the whole lead store"""
+    print(f"\n[5/6] Consolidating results...")
+    total = store.export_csv(CONSOLIDATED_FILE)
+    print(f"  ✓ Wrote {total} leads from {STORE_FILE} to {CONSOLIDATED_FILE}")
+    print_statistics(store.statistics(), CONSOLIDATED_FILE)
 
 def main():
+    parser = argparse.ArgumentParser(description="Split leads into batches for enrichment and scoring")
+    parser.add_argument('--run', action='store_true',
+                        help="enrich, score and consolidate every batch here on all cores")
+    parser.add_argument('--agents', type=int, default=NUM_AGENTS,
+                        help=f"number of batches (default: one per core, {NUM_AGENTS})")
+    parser.add_argument('--shard', action='store_true',
+                        help="batch by company (all leads of a company in one batch) instead of row ranges")
+    args = parser.parse_args()
+
     print("=" * 80)
     print("LEAD ENRICHMENT AND SCORING ORCHESTRATION")
     print("=" * 80)
 
-    # Load data
-    print("\n[1/6] Loading data files...")
-    leads = load_csv(LEADS_FILE)
-    categories = load_csv(CATEGORY_FILE)
-    pivot_data = load_csv(PIVOT_FILE)
-
-    print(f"  ✓ Loaded {len(leads)} leads")
-    print(f"  ✓ Loaded {len(categories)} categories")
-    print(f"  ✓ Loaded {len(pivot_data)} brands from pivot table")
-
-    # Create batches
-    print(f"\n[2/6] Creating {NUM_AGENTS} batches...")
-    batches = create_batches(leads, NUM_AGENTS)
-    print(f"  ✓ Created {len(batches)} batches")
-    for batch in batches:
-        print(f"    - Batch {batch['batch_num']}: {len(batch['leads'])} leads (rows {batch['start_idx']}-{batch['end_idx']})")
-
-    # Save batch files
-    print(f"\n[3/6] Saving batch files...")
-    batch_files = save_batch_files(batches, OUTPUT_DIR, prefix="enrichment_batch")
-    print(f"  ✓ Saved {len(batch_files)} batch files to {OUTPUT_DIR}/")
+    # Steps 1-3 are skipped when the export, planner and options are unchanged. The
+    # Golden Sheet only feeds cost estimates, like the match cache, so a refresh keeps
+    # the plan and with it the chunks golden_sheet_diff.py lets --run carry over
+    cache = StageCache()
+    source_hash = file_hash(LEADS_FILE)
+    sheet_version = version(*GOLDEN_SHEET_FILES)
+    batching = [source_hash, version(*BATCHING_MODULES), args.agents, args.shard]
+    batch_outputs = [str(PLAN_FILE)] + [str(OUTPUT_DIR / f"enrichment_batch_{n}.json")
+                                        for n in range(1, args.agents + 1)]
+    cache.run('batching', batching, batch_outputs, lambda: plan(args, source_hash))
+    with open(PLAN_FILE, 'r', encoding='utf-8') as f:
+        batch_plan = json.load(f)
+    runs, header = batch_plan['runs'], batch_plan['header']
+    batch_nums = batch_plan['batches']
 
     # Create directories for results
     ENRICHED_DIR.mkdir(exist_ok=True)
     SCORED_DIR.mkdir(exist_ok=True)
 
+    if args.run:
+        # Enrichment and scoring are cached separately, so a scoring rule
+        # change rescores the enriched batches without matching them again
+        enriched, scored = result_files(batch_nums)
+        enrich = [cache.fingerprint('batching', *batching), sheet_version, version(*MATCHING_MODULES)]
+        score = [cache.fingerprint('enrich', *enrich), version(*SCORING_MODULES), engine.DEFAULT_SCORING]
+        chunk_versions = enrich[1:] + score[1:]
+        # Leads in the store are tagged with the fingerprint of the scores they carry
+        run = cache.fingerprint('score', *score)
+        store = LeadStore()
+        remove_stale_results(batch_nums)
+        if cache.run('enrich', enrich, enriched,
+                     lambda: enrich_and_score(runs, header, source_hash, chunk_versions, run,
+                                              args.shard)):
+            cache.run('score', score, scored, lambda: rescore(batch_nums))
+        else:
+            cache.run('score', score, scored, lambda: None)
+        load_batches(store, run, runs)
+
+        consolidating = [store.revision(), version('consolidate_results.py', 'score_stats.py', 'lead_store.py')]
+        cache.run('consolidate', consolidating, [CONSOLIDATED_FILE], lambda: consolidate(store))
+        store.close()
+
+        print("\n[6/6] RUN COMPLETE!")
+        print(cache.summary())
+        return
+
     print(f"\n[4/6] READY TO LAUNCH AGENTS")
     print("=" * 80)
     print("\nPHASE 1: ENRICHMENT AGENTS")
     print("  Task: Match companies to golden sheet data")
-    print("  Agents needed: 8 parallel agents")
-    print(f"  Input: {OUTPUT_DIR}/enrichment_batch_[1-8].json")
-    print(f"  Output: {ENRICHED_DIR}/enriched_batch_[1-8].csv")
+    print(f"  Agents needed: {len(batch_nums)} parallel agents")
+    print(f"  Input: {OUTPUT_DIR}/enrichment_batch_[1-{len(batch_nums)}].json")
+    print(f"  Output: {ENRICHED_DIR}/enriched_batch_[1-{len(batch_nums)}].csv")
     print("\nPHASE 2: SCORING AGENTS")
     print("  Task: Web research + comprehensive ICP scoring")
-    print("  Agents needed: 8 parallel agents")
-    print(f"  Input: {ENRICHED_DIR}/enriched_batch_[1-8].csv")
-    print(f"  Output: {SCORED_DIR}/scored_batch_[1-8].csv")
+    print(f"  Agents needed: {len(batch_nums)} parallel agents")
+    print(f"  Input: {ENRICHED_DIR}/enriched_batch_[1-{len(batch_nums)}].csv")
+    print(f"  Output: {SCORED_DIR}/scored_batch_[1-{len(batch_nums)}].csv")
     print("\n" + "=" * 80)
 
     # Generate agent instructions
@@ -118,7 +498,9 @@ def main():
 Process your assigned batch of leads and enrich each row with Golden Sheet data.
 
 ## Input Files
-- Your batch: agent_batches/enrichment_batch_[YOUR_NUMBER].json
+- Your batch: agent_batches/enrichment_batch_[YOUR_NUMBER].json (a manifest of rows
+  in {LEADS_FILE}; print your leads as CSV with
+  `python lead_manifest.py agent_batches/enrichment_batch_[YOUR_NUMBER].json`)
 - Category data: {CATEGORY_FILE}
 - Pivot table: {PIVOT_FILE}
 
@@ -232,8 +614,8 @@ Include ALL columns from enriched CSV plus score columns.
     print("\n✓ All batch files created")
     print("✓ Agent instructions ready")
     print("\nNext steps:")
-    print("  1. Launch 8 enrichment agents in parallel")
-    print("  2. Once enrichment complete, launch 8 scoring agents in parallel")
+    print(f"  1. Launch {len(batch_nums)} enrichment agents in parallel")
+    print(f"  2. Once enrichment complete, launch {len(batch_nums)} scoring agents in parallel")
     print("  3. Run consolidation script to merge all results")
     print("\n" + "=" * 80)
 
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Dense brand x platform asset counts from the Golden Sheet pivot table
+
+The pivot table's per-platform columns (amazon_prime, instagram, netflix,
+standalone, tiktok, youtube_shorts) are loaded once into an int32 matrix with
+one row per brand. The per-brand strings the enrichment output needs
+(platforms_tested and the platform_breakdown JSON) are precomputed from it, so
+a lead costs one dict lookup however many platforms the sheet grows, and
+questions like "brands with more than 20 TikTok assets" or "platform share
+per category" are single NumPy expressions over the whole sheet.
+"""
+
+import json
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+import numpy as np
+
+
+class PlatformMatrix:
+    """counts[i, j] = assets of brand names[i] on platforms[j]"""
+
+    def __init__(self, names: Sequence[str], counts: Sequence[Sequence[int]], platforms: Sequence[str]):
+        self.names = list(names)
+        self.platforms = list(platforms)
+        self.counts = np.array(counts, dtype=np.int32).reshape(len(self.names), len(self.platforms))
+
+        self._rows: Dict[str, int] = {}
+        for row, name in enumerate(self.names):
+            self._rows.setdefault(name, row)
+
+        platforms_arr = np.array(self.platforms, dtype=object)
+        tested = self.counts > 0
+        self._tested = [', '.join(platforms_arr[mask]) for mask in tested]
+        self._breakdowns = [
+            json.dumps(dict(zip(platforms_arr[mask].tolist(), row[mask].tolist())))
+            for mask, row in zip(tested, self.counts)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def tested(self, name: str) -> str:
+        """Comma-separated platforms the brand has assets on ('' if unknown)"""
+        row = self._rows.get(name)
+        return self._tested[row] if row is not None else ''
+
+    def breakdown(self, name: str) -> str:
+        """platform_breakdown JSON for a brand, e.g. {"standalone": 40, "tiktok": 133}"""
+        row = self._rows.get(name)
+        return self._breakdowns[row] if row is not None else ''
+
+    def column(self, platform: str) -> np.ndarray:
+        """Asset counts of every brand on one platform"""
+        return self.counts[:, self.platforms.index(platform)]
+
+    def brands_with(self, platform: str, min_assets: int = 1) -> List[str]:
+        """Brands with at least min_assets assets on platform, most assets first"""
+        column = self.column(platform)
+        rows = np.flatnonzero(column >= min_assets)
+        rows = rows[np.argsort(-column[rows], kind='stable')]
+        return [self.names[row] for row in rows]
+
+    def totals(self) -> Dict[str, int]:
+        """Assets per platform across all brands"""
+        return dict(zip(self.platforms, self.counts.sum(axis=0).tolist()))
+
+    def platform_share(self, groups: Mapping[str, Iterable[str]]) -> Dict[str, Dict[str, float]]:
+        """Share of each group's assets per platform
+
+        groups maps a label (e.g. a company category) to brand names; unknown
+        names are ignored and a group without assets gets all-zero shares.
+        """
+        labels = list(groups)
+        membership = np.zeros((len(labels), len(self.names)), dtype=np.int32)
+        for i, label in enumerate(labels):
+            rows = [self._rows[name] for name in groups[label] if name in self._rows]
+            membership[i, rows] = 1
+
+        sums = (membership @ self.counts).astype(np.float64)
+        totals = sums.sum(axis=1, keepdims=True)
+        shares = np.divide(sums, totals, out=np.zeros_like(sums), where=totals > 0)
+        return {label: dict(zip(self.platforms, row.round(4).tolist())) for label, row in zip(labels, shares)}
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Streaming ICP score statistics
+
+icp_score has one decimal on a 1-10 scale, so a Counter of distinct scores
+holds at most ~100 entries and gives the exact count, mean, median, min, max
+and range counts of any number of leads without keeping the scores in a list.
+"""
+
+from collections import Counter
+
+
+class ScoreStats:
+    """Histogram of icp_score values"""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def add(self, score: float):
+        self.counts[score] += 1
+
+    def __len__(self) -> int:
+        return sum(self.counts.values())
+
+    def mean(self) -> float:
+        return sum(score * count for score, count in self.counts.items()) / len(self)
+
+    def median(self) -> float:
+        """scores[n // 2] of the scores sorted from highest to lowest"""
+        position = len(self) // 2
+        for score in sorted(self.counts, reverse=True):
+            position -= self.counts[score]
+            if position < 0:
+                return score
+        raise ValueError("no scores")
+
+    def max(self) -> float:
+        return max(self.counts)
+
+    def min(self) -> float:
+        return min(self.counts)
+
+    def between(self, low: float = float('-inf'), high: float = float('inf')) -> int:
+        """Number of scores with low <= score < high"""
+        return sum(count for score, count in self.counts.items() if low <= score < high)
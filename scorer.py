@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Data-driven ICP lead scorer
+
+Scoring rules live as data in scoring_rules.py, the same way category rules
+live in category_rules.py: each factor (seniority, role, category fit) is an
+ordered list of tiers where the first tier whose conditions all hold gives
+the factor's score, and Golden Sheet presence maps total assets (or, for
+brands outside the sheet, company keywords) to the company and asset scores.
+The weighted sum of the factors is the lead's icp_score.
+"""
+
+from typing import Callable, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+# Share of each factor in the final score
+WEIGHTS = {'seniority': 0.30, 'company': 0.25, 'assets': 0.20, 'role': 0.15, 'category': 0.10}
+MAX_SCORE = 10
+
+# Lead columns the conditions look at (all compared lowercased)
+FIELDS = {
+    'title': 'font-qanelas 8',
+    'headline': 'font-qanelas',
+    'company': 'inline-flex',
+    'category': 'company_category',
+}
+
+
+class When(NamedTuple):
+    """Condition that holds if ANY keyword is a substring of its field"""
+    title: Sequence[str] = ()
+    headline: Sequence[str] = ()
+    company: Sequence[str] = ()
+    category: Sequence[str] = ()
+
+
+class Tier(NamedTuple):
+    """Score given when ALL of its conditions hold"""
+    score: float
+    conditions: Tuple[When, ...]
+
+
+def tier(score: float, *conditions: When) -> Tier:
+    """Tier(score, conditions) without spelling out the tuple"""
+    return Tier(score, conditions)
+
+
+class Factor(NamedTuple):
+    tiers: Sequence[Tier]
+    default: float
+
+
+class AssetTier(NamedTuple):
+    """Company and asset scores of a Golden Sheet brand with min_assets or more"""
+    min_assets: int
+    company: float
+    assets: float
+
+
+class CompanyTier(NamedTuple):
+    """Company and asset scores of a company outside the Golden Sheet"""
+    company: float
+    assets: float
+    condition: When
+
+
+class Scores(NamedTuple):
+    total: float
+    seniority: float
+    company: float
+    assets: float
+    category: float
+    role: float
+
+
+class ScoringRuleset(NamedTuple):
+    """seniority/role/category: first matching tier wins
+
+    golden: tiers for leads in the Golden Sheet, highest min_assets first;
+    boost adds to their company score (capped at MAX_SCORE) when it matches.
+    outside: tiers for leads outside the sheet, outside_default if none match.
+    reasoning: builds score_reasoning from the lead and its Scores.
+    """
+    seniority: Factor
+    role: Factor
+    category: Factor
+    golden: Sequence[AssetTier]
+    outside: Sequence[CompanyTier]
+    outside_default: Tuple[float, float]
+    reasoning: Callable[[Mapping[str, str], Scores], str]
+    boost: Optional[Tier] = None
+
+
+def _to_int(value) -> int:
+    try:
+        return int(value) if value not in (None, '') else 0
+    except ValueError:
+        return 0
+
+
+def _holds(condition: When, fields: Dict[str, str]) -> bool:
+    return any(keyword in fields[name]
+               for name, keywords in condition._asdict().items() for keyword in keywords)
+
+
+class Scorer:
+    """ScoringRuleset applied to enriched leads"""
+
+    def __init__(self, ruleset: ScoringRuleset):
+        self.ruleset = ruleset
+
+    def _factor(self, factor: Factor, fields: Dict[str, str]) -> float:
+        for t in factor.tiers:
+            if all(_holds(c, fields) for c in t.conditions):
+                return t.score
+        return factor.default
+
+    def _company(self, lead: Mapping[str, str], fields: Dict[str, str]) -> Tuple[float, float]:
+        rules = self.ruleset
+        if lead.get('brand_in_golden_sheet', 'No') != 'Yes':
+            for t in rules.outside:
+                if _holds(t.condition, fields):
+                    return t.company, t.assets
+            return rules.outside_default
+
+        total_assets = _to_int(lead.get('total_assets_tested'))
+        company, assets = rules.golden[-1].company, rules.golden[-1].assets
+        for t in rules.golden:
+            if total_assets >= t.min_assets:
+                company, assets = t.company, t.assets
+                break
+        if rules.boost and all(_holds(c, fields) for c in rules.boost.conditions):
+            company = min(MAX_SCORE, company + rules.boost.score)
+        return company, assets
+
+    def score(self, lead: Mapping[str, str]) -> Scores:
+        """Factor scores and weighted icp_score of one enriched lead"""
+        fields = {name: (lead.get(column) or '').lower() for name, column in FIELDS.items()}
+        seniority = self._factor(self.ruleset.seniority, fields)
+        company, assets = self._company(lead, fields)
+        category = self._factor(self.ruleset.category, fields)
+        role = self._factor(self.ruleset.role, fields)
+
+        total = (seniority * WEIGHTS['seniority'] +
+                 company * WEIGHTS['company'] +
+                 assets * WEIGHTS['assets'] +
+                 role * WEIGHTS['role'] +
+                 category * WEIGHTS['category'])
+        return Scores(round(total, 1), seniority, company, assets, category, role)
+
+    def reasoning(self, lead: Mapping[str, str], scores: Scores) -> str:
+        """score_reasoning text for a scored lead"""
+        return self.ruleset.reasoning(lead, scores)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+ICP scoring rules, one ruleset per former scoring script
+
+Each ruleset is a scoring script's score_lead if/elif chains as data, so the
+tiers keep their precedence: 'score_leads' is score_leads.py (the rules every
+batch but 5 was scored with) and 'score_batch_5' is score_batch_5.py with its
+finer seniority and role tiers and the tier-1/tier-2 company lists. Keywords
+inside one When(...) are alternatives; several When(...) in one tier must all
+hold. Apply a ruleset with scorer.Scorer.
+"""
+
+from scorer import AssetTier, CompanyTier, Factor, Scores, ScoringRuleset, When, tier
+
+DIRECTOR = ['vp', 'vice president', 'director', 'head of']
+TOP_CATEGORIES = ['Beauty and Personal Care', 'Electronics and Technology', 'Food and Beverage',
+                  'Entertainment and Streaming', 'Fashion and Accessories']
+
+
+def _company_reasoning(lead, scores: Scores) -> str:
+    if scores.seniority >= 8:
+        seniority_desc = "Senior/Director-level"
+    elif scores.seniority >= 6:
+        seniority_desc = "Mid-level manager"
+    else:
+        seniority_desc = "Entry/Junior-level"
+
+    if lead.get('brand_in_golden_sheet', 'No') == 'Yes':
+        golden_desc = f"IN Golden Sheet with {lead.get('total_assets_tested', '0')} tested assets (major signal)"
+    else:
+        golden_desc = "NOT in Golden Sheet (significant gap)"
+
+    category_name = lead.get('company_category', '')
+    if category_name in TOP_CATEGORIES:
+        category_desc = f"perfect category fit ({category_name})"
+    else:
+        category_desc = f"moderate category fit ({category_name})"
+
+    reasoning = (f"{seniority_desc} brand role at {lead.get('inline-flex', '')}. {golden_desc}. "
+                 f"Strong {category_desc} with clear brand marketing focus.")
+    return reasoning[:250]
+
+
+def _tiered_reasoning(lead, scores: Scores) -> str:
+    if scores.seniority >= 8.5:
+        seniority_desc = "Senior/Director-level"
+    elif scores.seniority >= 7:
+        seniority_desc = "Mid-Senior level"
+    elif scores.seniority >= 6:
+        seniority_desc = "Manager-level"
+    else:
+        seniority_desc = "Junior/Entry-level"
+
+    total_assets = lead.get('total_assets_tested') or '0'
+    if lead.get('brand_in_golden_sheet', 'No') == 'Yes':
+        if int(total_assets) >= 50:
+            golden_desc = f"IN Golden Sheet with {total_assets} assets (excellent signal)"
+        elif int(total_assets) >= 20:
+            golden_desc = f"IN Golden Sheet with {total_assets} assets (strong signal)"
+        else:
+            golden_desc = f"IN Golden Sheet ({total_assets} assets)"
+    else:
+        golden_desc = "NOT in Golden Sheet"
+
+    category_desc = lead.get('company_category', '') or "Unknown category"
+
+    if scores.role >= 9:
+        role_desc = "Perfect brand marketing fit"
+    elif scores.role >= 7:
+        role_desc = "Strong brand focus"
+    elif scores.role >= 5:
+        role_desc = "Moderate brand involvement"
+    else:
+        role_desc = "Limited marketing authority"
+
+    reasoning = f"{seniority_desc} at {lead.get('inline-flex', '')}. {golden_desc}. {category_desc}. {role_desc}."
+    return reasoning[:300]
+
+
+NON_MARKETING = ['protection', 'registry', 'onboarding', 'event manager', 'technical',
+                 'program manager, brand', 'archivist', 'commercialization']
+TIER1 = ['amazon', 'nike', 'disney', 'coca-cola', 'samsung', 'apple']
+TIER2 = ['ford', 'philips', 't-mobile', 'directv', 'petsmart', 'sainsbury', 'burger king', 'jeep']
+
+SCORING_RULESETS = {
+    'score_leads': ScoringRuleset(
+        seniority=Factor(default=4, tiers=[
+            tier(9, When(title=DIRECTOR, headline=DIRECTOR)),
+            tier(8, When(title=['senior manager', 'sr manager', 'sr. manager', 'lead manager', '(lead)'],
+                         headline=['senior manager', 'sr manager', 'sr. manager', 'lead manager', '(lead)'])),
+            tier(8, When(title=['senior brand', 'sr brand', 'sr. brand'])),
+            tier(6.5, When(title=['manager']), When(title=['brand'])),
+            tier(6, When(title=['manager'])),
+        ]),
+        role=Factor(default=5, tiers=[
+            tier(10, When(title=['brand']), When(title=['marketing'])),
+            tier(10, When(title=['brand']), When(title=['manager'])),
+            tier(10, When(headline=['influencer'])),
+            tier(8, When(title=['brand'])),
+            tier(7, When(title=['marketing', 'innovation lab'])),
+        ]),
+        category=Factor(default=5, tiers=[
+            tier(10, When(category=['beauty', 'electronics', 'food and beverage', 'entertainment'])),
+            tier(10, When(category=['fashion', 'accessories'])),
+            tier(6, When(category=['automotive', 'health', 'wellness'])),
+        ]),
+        golden=[AssetTier(50, 10, 10), AssetTier(20, 9, 7), AssetTier(10, 8, 6), AssetTier(0, 8, 5)],
+        outside=[
+            CompanyTier(4, 0, When(company=['apple', 'amazon', 'nike', 'coca-cola', 'disney', 'ford',
+                                            'estée lauder', 'estee lauder'])),
+        ],
+        outside_default=(3, 0),
+        reasoning=_company_reasoning,
+    ),
+
+    'score_batch_5': ScoringRuleset(
+        seniority=Factor(default=4.5, tiers=[
+            tier(9.0, When(title=DIRECTOR, headline=DIRECTOR)),
+            tier(8.0, When(title=['senior manager', 'sr manager', 'sr. manager'],
+                           headline=['senior manager', 'sr manager', 'sr. manager'])),
+            tier(7.5, When(title=['senior', 'sr ', 'sr.'])),
+            tier(6.5, When(title=['manager'], headline=['manager'])),
+            tier(7.0, When(title=['lead'], headline=['lead'])),
+        ]),
+        role=Factor(default=5, tiers=[
+            tier(10, When(title=['brand marketing manager'], headline=['brand marketing manager'])),
+            tier(4, When(title=['brand manager']), When(title=NON_MARKETING, headline=NON_MARKETING)),
+            tier(9.5, When(title=['brand manager'])),
+            tier(7, When(title=['brand insights'], headline=['brand insights'])),
+            tier(9.5, When(title=['brand']), When(title=['marketing'])),
+            tier(3.5, When(title=['brand']), When(title=NON_MARKETING, headline=NON_MARKETING)),
+            tier(8, When(title=['brand'])),
+            tier(9, When(headline=['influencer', 'creator'])),
+            tier(7, When(title=['marketing'])),
+            tier(6, When(title=['solutions manager']), When(headline=['brand'])),
+        ]),
+        category=Factor(default=5, tiers=[
+            tier(10, When(category=['beauty', 'electronics', 'food', 'beverage', 'entertainment'])),
+            tier(8, When(category=['fashion', 'accessories', 'retail'])),
+            tier(7, When(category=['automotive', 'health', 'wellness', 'telecom'])),
+        ]),
+        golden=[AssetTier(50, 10, 10), AssetTier(20, 9, 7), AssetTier(10, 8.5, 6), AssetTier(0, 8, 5)],
+        boost=tier(0.5, When(company=TIER1)),
+        outside=[
+            CompanyTier(5, 2, When(company=TIER1)),
+            CompanyTier(4, 1, When(company=TIER2)),
+        ],
+        outside_default=(3, 0),
+        reasoning=_tiered_reasoning,
+    ),
+}
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Threshold-aware SequenceMatcher similarity for fuzzy brand matching
+
+Fuzzy passes only care whether a brand beats a cutoff (the threshold, or the
+best score found so far), so most pairs can be rejected without computing
+SequenceMatcher.ratio(). Each pair goes through increasingly expensive upper
+bounds on the ratio and stops at the first one that cannot beat the cutoff:
+1. length bound: 2 * min(len) / total
+2. real_quick_ratio() and quick_ratio()
+3. banded indel distance: the matched characters of ratio() form a common
+   subsequence, so 2 * LCS / total bounds it, and only a diagonal band of the
+   LCS table can keep that bound above the cutoff
+Survivors get the real ratio(), so any score returned is exactly ratio().
+One SequenceMatcher is kept per brand with the brand as its second sequence,
+so its b2j and character-count tables are built once, not once per company.
+"""
+
+from difflib import SequenceMatcher
+from typing import List, Optional, Sequence
+
+
+def beats(bound: float, cutoff: float, inclusive: bool) -> bool:
+    """Whether a score of bound clears cutoff"""
+    return bound >= cutoff if inclusive else bound > cutoff
+
+
+def banded_lcs(a: str, b: str, max_distance: int) -> int:
+    """Length of the longest common subsequence of a and b, or -1
+
+    Only cells within max_distance indels of the diagonal are computed; -1
+    means every common subsequence needs more than max_distance insertions
+    and deletions, i.e. LCS < (len(a) + len(b) - max_distance) / 2.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return -1
+
+    # previous[j] = LCS of a[:i-1] and b[:j]; cells outside the band stay at
+    # -inf so they can never feed a path that leaves the band
+    outside = float('-inf')
+    previous = [0 if j <= max_distance else outside for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [outside] * (len(b) + 1)
+        low = max(0, i - max_distance)
+        high = min(len(b), i + max_distance)
+        if low == 0:
+            current[0] = 0
+        char = a[i - 1]
+        for j in range(max(low, 1), high + 1):
+            if char == b[j - 1]:
+                current[j] = previous[j - 1] + 1
+            else:
+                current[j] = max(previous[j], current[j - 1])
+        previous = current
+
+    lcs = previous[len(b)]
+    if lcs == outside or len(a) + len(b) - 2 * lcs > max_distance:
+        return -1
+    return int(lcs)
+
+
+class SimilarityKernel:
+    """ratio(name, brand) with early exit, for a fixed list of brand names"""
+
+    def __init__(self, names: Sequence[str]):
+        self.names = list(names)
+        self._matchers: List[Optional[SequenceMatcher]] = [None] * len(self.names)
+
+    def _matcher(self, pos: int) -> SequenceMatcher:
+        matcher = self._matchers[pos]
+        if matcher is None:
+            matcher = SequenceMatcher(None, '', self.names[pos])
+            self._matchers[pos] = matcher
+        return matcher
+
+    def ratio_above(self, name: str, pos: int, cutoff: float,
+                    inclusive: bool = False) -> Optional[float]:
+        """SequenceMatcher(None, name, brand).ratio() if it beats cutoff, else None
+
+        Beating means `> cutoff`, or `>= cutoff` when inclusive.
+        """
+        brand = self.names[pos]
+        total = len(name) + len(brand)
+        if not total:
+            return 1.0 if beats(1.0, cutoff, inclusive) else None
+
+        if not beats(2.0 * min(len(name), len(brand)) / total, cutoff, inclusive):
+            return None
+
+        matcher = self._matcher(pos)
+        matcher.set_seq1(name)
+        if not beats(matcher.real_quick_ratio(), cutoff, inclusive):
+            return None
+        if not beats(matcher.quick_ratio(), cutoff, inclusive):
+            return None
+
+        # ratio = 2M / total with M <= LCS = (total - indels) / 2, so beating
+        # cutoff needs indels < (1 - cutoff) * total
+        max_distance = int((1.0 - cutoff) * total) + 1
+        lcs = banded_lcs(name, brand, max_distance)
+        if lcs < 0 or not beats(2.0 * lcs / total, cutoff, inclusive):
+            return None
+
+        score = matcher.ratio()
+        return score if beats(score, cutoff, inclusive) else None
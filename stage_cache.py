@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of pipeline stage outputs
+
+Each stage (batching, enrich, score, consolidate, stats) is fingerprinted
+from everything its output depends on: the SHA-256 of the data files it
+reads, the Golden Sheet version, the version of the rules it applies and
+its own options. Its output files (and, for stages that report, what it
+printed) are stored under .stage_cache/<stage>/<fingerprint>/. When a stage
+comes up again with the same fingerprint, the stored files are copied back
+and the stage is not run at all, like make but keyed on content rather
+than timestamps.
+
+Rule versions are hashes of the modules that implement them, so editing a
+category or scoring rule invalidates exactly the stages that apply it.
+"""
+
+import io
+import json
+import os
+import shutil
+import sys
+from contextlib import redirect_stdout
+from functools import lru_cache
+from typing import Callable, Iterable, Sequence
+
+from checkpoint import atomic_open, content_key
+from golden_sheet import CATEGORY_FILE, PIVOT_FILE
+from industry_categories import INDUSTRY_CATEGORIES_FILE
+from match_cache import file_hash
+
+CACHE_DIR = ".stage_cache"
+
+GOLDEN_SHEET_FILES = (PIVOT_FILE, CATEGORY_FILE, INDUSTRY_CATEGORIES_FILE)
+
+# Modules whose code decides each stage's output
+MATCHING_MODULES = ('engine.py', 'golden_sheet.py', 'brand_index.py', 'bulk_match.py', 'aho_corasick.py',
+                    'blocking.py', 'similarity.py', 'name_normalization.py', 'platform_matrix.py',
+                    'market_codes.py', 'industry_categories.py', 'categorizer.py', 'category_rules.py')
+SCORING_MODULES = ('scorer.py', 'scoring_rules.py')
+BATCHING_MODULES = ('batch_planner.py', 'lead_manifest.py')
+
+
+@lru_cache(maxsize=None)
+def version(*filepaths: str) -> str:
+    """Content hash of a group of files (modules, reference data) that do not change during a run"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    return hashes_version(file_hash(path if os.path.exists(path) else os.path.join(here, path))
+                          for path in filepaths)
+
+
+def hashes_version(hashes: Iterable[str]) -> str:
+    """version() of files with the given SHA-256 hashes, e.g. of files that have since been replaced"""
+    return content_key(list(hashes))
+
+
+class _Tee(io.TextIOBase):
+    """Text stream writing to the real stdout and a buffer"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffer = io.StringIO()
+
+    def write(self, text):
+        self.stream.write(text)
+        return self.buffer.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+class StageCache:
+    """Stage outputs stored under .stage_cache/<stage>/<fingerprint>/"""
+
+    def __init__(self, directory: str = CACHE_DIR):
+        self.directory = directory
+        self.hits = []
+        self.misses = []
+
+    def fingerprint(self, stage: str, *inputs) -> str:
+        """Fingerprint of a stage run over JSON-serializable inputs (hashes, options)"""
+        return content_key(stage, *inputs)
+
+    def _entry(self, stage: str, key: str) -> str:
+        return os.path.join(self.directory, stage, key)
+
+    def restore(self, stage: str, key: str) -> bool:
+        """Copy a stored stage's outputs back into place and replay its output; False on a miss"""
+        entry = self._entry(stage, key)
+        try:
+            with open(os.path.join(entry, 'outputs.json'), 'r', encoding='utf-8') as f:
+                outputs = json.load(f)
+        except FileNotFoundError:
+            return False
+        for i, filepath in enumerate(outputs['files']):
+            if os.path.dirname(filepath):
+                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(os.path.join(entry, str(i)), 'rb') as src, atomic_open(filepath, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+        sys.stdout.write(outputs['stdout'])
+        return True
+
+    def store(self, stage: str, key: str, files: Sequence[str], stdout: str = '') -> None:
+        """Store a stage's output files (and printed output) under its fingerprint"""
+        entry = self._entry(stage, key)
+        tmp_entry = f"{entry}.tmp"
+        shutil.rmtree(tmp_entry, ignore_errors=True)
+        os.makedirs(tmp_entry)
+        for i, filepath in enumerate(files):
+            shutil.copyfile(filepath, os.path.join(tmp_entry, str(i)))
+        with open(os.path.join(tmp_entry, 'outputs.json'), 'w', encoding='utf-8') as f:
+            json.dump({'files': list(files), 'stdout': stdout}, f)
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp_entry, entry)
+
+    def run(self, stage: str, inputs: Sequence, outputs: Sequence[str], fn: Callable[[], object]) -> bool:
+        """Restore stage's outputs from the cache, or run fn and store the outputs it wrote
+
+        Whatever fn prints is stored with the output files and printed again
+        on a hit. Returns True on a cache hit.
+        """
+        key = self.fingerprint(stage, *inputs)
+        if self.restore(stage, key):
+            self.hits.append(stage)
+            return True
+        tee = _Tee(sys.stdout)
+        with redirect_stdout(tee):
+            fn()
+        self.store(stage, key, outputs, tee.buffer.getvalue())
+        self.misses.append(stage)
+        return False
+
+    def summary(self) -> str:
+        hits = ', '.join(self.hits) or 'none'
+        misses = ', '.join(self.misses) or 'none'
+        return f"Stage cache: hit {hits}; ran {misses}"